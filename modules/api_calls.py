@@ -4,31 +4,47 @@ import base64
 import requests
 import logging
 import re  # Added missing import
+import threading
+from functools import lru_cache
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from mistralai import Mistral
 
 logger = logging.getLogger(__name__)
 
-def encode_image_to_base64(image_path):
-    """Encode image to base64 string."""
+# Cap on provider requests in flight at once when pages are processed concurrently
+MAX_CONCURRENT_API_CALLS = int(os.getenv("MAX_CONCURRENT_API_CALLS", "8"))
+_api_call_slots = threading.BoundedSemaphore(MAX_CONCURRENT_API_CALLS)
+
+# One keep-alive connection pool for REST calls, sized for the concurrent page workers
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_API_CALLS))
+
+@lru_cache(maxsize=None)
+def _openai_client(api_key):
+    """Return a shared OpenAI client for the key so its connection pool is reused across pages."""
+    import openai
+    return openai.OpenAI(api_key=api_key)
+
+def encode_image_to_base64(image_path, image_bytes=None):
+    """Encode image to base64 string, using image_bytes directly when provided."""
+    if image_bytes is not None:
+        return base64.b64encode(image_bytes).decode('utf-8')
     with open(image_path, "rb") as image_file:
         return base64.b64encode(image_file.read()).decode('utf-8')
 
-def call_openai_api(image_path, prompt, model_name="gpt-4o"):
+def call_openai_api(image_path, prompt, model_name="gpt-4o", image_bytes=None):
     """Call OpenAI's GPT-4 Vision API with the image and prompt."""
     try:
-        import openai
-        
         # Set API key from environment variable
         openai_api_key = os.getenv("OPENAI_API_KEY")
         if not openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        client = openai.OpenAI(api_key=openai_api_key)
+        client = _openai_client(openai_api_key)
         
         # Read and encode the image
-        with open(image_path, "rb") as image_file:
-            encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
+        encoded_image = encode_image_to_base64(image_path, image_bytes)
         
         # Create the messages with the image and prompt
         messages = [
@@ -58,17 +74,16 @@ def call_openai_api(image_path, prompt, model_name="gpt-4o"):
         logger.error(f"Error calling OpenAI API: {e}")
         raise
 
-def call_openai_api_correction(image_path, raw_text, prompt_template, context, page_num, model_name="gpt-4o"):
+def call_openai_api_correction(image_path, raw_text, prompt_template, context, page_num, model_name="gpt-4o",
+                               image_bytes=None):
     """Call OpenAI's GPT-4 Vision API for OCR correction with both image and raw text."""
     try:
-        import openai
-        
         # Set API key from environment variable
         openai_api_key = os.getenv("OPENAI_API_KEY")
         if not openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        client = openai.OpenAI(api_key=openai_api_key)
+        client = _openai_client(openai_api_key)
         
         # Generate prompt with raw text
         prompt = prompt_template.format(
@@ -78,8 +93,7 @@ def call_openai_api_correction(image_path, raw_text, prompt_template, context, p
         )
         
         # Read and encode the image
-        with open(image_path, "rb") as image_file:
-            encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
+        encoded_image = encode_image_to_base64(image_path, image_bytes)
         
         # Create the messages with both the image and text
         messages = [
@@ -112,14 +126,12 @@ def call_openai_api_correction(image_path, raw_text, prompt_template, context, p
 def call_openai_api_text(text_content, prompt_template=None, model_name="gpt-4o"):
     """Call OpenAI's API with text-only prompt."""
     try:
-        import openai
-        
         # Set API key from environment variable
         openai_api_key = os.getenv("OPENAI_API_KEY")
         if not openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        client = openai.OpenAI(api_key=openai_api_key)
+        client = _openai_client(openai_api_key)
         
         # Format the prompt if a template is provided
         if prompt_template:
@@ -152,11 +164,11 @@ def call_openai_api_text(text_content, prompt_template=None, model_name="gpt-4o"
         logger.error(f"Error calling OpenAI API: {e}")
         raise
 
-def call_gemini_api(image_path, prompt):
+def call_gemini_api(image_path, prompt, image_bytes=None):
     """Call Gemini API with the image and prompt."""
     url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={os.getenv('GOOGLE_API_KEY')}"
     
-    encoded_image = encode_image_to_base64(image_path)
+    encoded_image = encode_image_to_base64(image_path, image_bytes)
     
     payload = {
         "contents": [{
@@ -174,14 +186,14 @@ def call_gemini_api(image_path, prompt):
     headers = {
         "Content-Type": "application/json"
     }
-    response = requests.post(url, headers=headers, json=payload)
+    response = _http_session.post(url, headers=headers, json=payload)
     
     if response.status_code == 200:
         return response.json()
     else:
         raise Exception(f"API request failed with status code {response.status_code}: {response.text}")
 
-def call_gemini_api_correction(image_path, raw_text, prompt_template, context, page_num):
+def call_gemini_api_correction(image_path, raw_text, prompt_template, context, page_num, image_bytes=None):
     """Call Gemini API for OCR correction with both image and raw text."""
     url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={os.getenv('GOOGLE_API_KEY')}"
     
@@ -191,7 +203,7 @@ def call_gemini_api_correction(image_path, raw_text, prompt_template, context, p
         context=context,
         raw_text=raw_text
     )
-    encoded_image = encode_image_to_base64(image_path)
+    encoded_image = encode_image_to_base64(image_path, image_bytes)
     payload = {
         "contents": [{
             "parts": [
@@ -208,7 +220,7 @@ def call_gemini_api_correction(image_path, raw_text, prompt_template, context, p
     headers = {
         "Content-Type": "application/json"
     }
-    response = requests.post(url, headers=headers, json=payload)
+    response = _http_session.post(url, headers=headers, json=payload)
     
     if response.status_code == 200:
         return response.json()
@@ -235,7 +247,7 @@ def call_gemini_api_text(text_content, prompt_template=None):
     headers = {
         "Content-Type": "application/json"
     }
-    response = requests.post(url, headers=headers, json=payload)
+    response = _http_session.post(url, headers=headers, json=payload)
     
     if response.status_code == 200:
         return response.json()
@@ -244,14 +256,18 @@ def call_gemini_api_text(text_content, prompt_template=None):
 
 # Add Mistral API initialization
 def get_mistral_client():
-    """Initialize and return a Mistral client."""
+    """Return the shared Mistral client for the configured API key."""
     mistral_api_key = os.getenv("MISTRAL_API_KEY")
     if not mistral_api_key:
         raise ValueError("MISTRAL_API_KEY environment variable not set")
-    return Mistral(api_key=mistral_api_key)
+    return _mistral_client(mistral_api_key)
 
-def call_mistral_ocr(image_path):
-    """Process a local PDF or image file using Mistral AI OCR."""
+@lru_cache(maxsize=None)
+def _mistral_client(api_key):
+    return Mistral(api_key=api_key)
+
+def call_mistral_ocr(image_path, image_bytes=None):
+    """Process a local PDF or image file (or in-memory image bytes) using Mistral AI OCR."""
     logger.info(f"Processing with Mistral OCR: {image_path}")
     
     try:
@@ -261,7 +277,7 @@ def call_mistral_ocr(image_path):
         uploaded_file = client.files.upload(
             file={
                 "file_name": os.path.basename(image_path),
-                "content": open(image_path, "rb"),
+                "content": image_bytes if image_bytes is not None else open(image_path, "rb"),
             },
             purpose="ocr"
         )
@@ -284,6 +300,16 @@ def call_mistral_ocr(image_path):
         logger.error(f"Error calling Mistral OCR API: {e}")
         raise
 
+# Markdown cleanup applied to Mistral OCR pages, in order
+_MARKDOWN_CLEANUP = (
+    (re.compile(r'!\[.*?\]\(.*?\)\n?'), ''),  # Markdown images ![alt text](image.jpg)
+    (re.compile(r'<img[^>]*>'), ''),  # HTML img tags
+    (re.compile(r'\*\*(.*?)\*\*'), r'\1'),  # Bold
+    (re.compile(r'\*(.*?)\*'), r'\1'),  # Italic
+    (re.compile(r'\[(.*?)\]\(.*?\)'), r'\1'),  # Links
+    (re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE), r'\1'),  # Headings
+)
+
 def extract_text_from_mistral_response(response):
     """Extract plain text from Mistral OCR response."""
     if not response:
@@ -298,40 +324,47 @@ def extract_text_from_mistral_response(response):
             if hasattr(page, 'markdown'):
                 # Clean markdown - remove images and formatting
                 page_text = page.markdown
-                # Remove markdown image syntax ![alt text](image.jpg)
-                page_text = re.sub(r'!\[.*?\]\(.*?\)\n?', '', page_text)
-                # Remove HTML img tags
-                page_text = re.sub(r'<img[^>]*>', '', page_text)
-                # Remove markdown formatting (bold, italic, etc.)
-                page_text = re.sub(r'\*\*(.*?)\*\*', r'\1', page_text)
-                page_text = re.sub(r'\*(.*?)\*', r'\1', page_text)
-                page_text = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', page_text)
-                page_text = re.sub(r'^#{1,6}\s+(.+)$', r'\1', page_text, flags=re.MULTILINE)
+                for pattern, replacement in _MARKDOWN_CLEANUP:
+                    page_text = pattern.sub(replacement, page_text)
                 
                 text += page_text + "\n\n"
     
     return text.strip()
 
 def call_api_for_model(model, api_type, image_path=None, prompt=None, 
-                       prompt_template=None, context=None, page_num=None, **kwargs):
-    """Unified API call function that routes to the correct model and API type."""
+                       prompt_template=None, context=None, page_num=None, image_bytes=None, **kwargs):
+    """Unified API call function that routes to the correct model and API type.
+    
+    Image inputs can be given as a file path or as in-memory image_bytes
+    (image_path is then only used as a display/file name).
+    """
+    with _api_call_slots:
+        return _dispatch_api_call(model, api_type, image_path, prompt, prompt_template, context, page_num,
+                                  image_bytes)
+
+def _dispatch_api_call(model, api_type, image_path, prompt, prompt_template, context, page_num, image_bytes=None):
+    """Route a call to the API function for the given model and API type."""
+    has_image = bool(image_path) or image_bytes is not None
+    
     # Add support for Mistral OCR
-    if model == "mistral-ocr" and api_type == "vision" and image_path:
-        return {"content": [{"text": call_mistral_ocr(image_path)}]}
+    if model == "mistral-ocr" and api_type == "vision" and has_image:
+        return {"content": [{"text": call_mistral_ocr(image_path or "page.jpg", image_bytes=image_bytes)}]}
         
-    elif api_type == "vision" and image_path:
+    elif api_type == "vision" and has_image:
         # Vision API calls (OCR)
         if model == "gemini":
-            return call_gemini_api(image_path, prompt)
+            return call_gemini_api(image_path, prompt, image_bytes=image_bytes)
         elif model in ["gpt-4", "gpt-4o", "gpt-4o-mini"]:
-            return call_openai_api(image_path, prompt, model_name=model)
+            return call_openai_api(image_path, prompt, model_name=model, image_bytes=image_bytes)
     
-    elif api_type == "correction" and image_path and prompt and prompt_template:
+    elif api_type == "correction" and has_image and prompt and prompt_template:
         # Correction API calls
         if model == "gemini":
-            return call_gemini_api_correction(image_path, prompt, prompt_template, context, page_num)
+            return call_gemini_api_correction(image_path, prompt, prompt_template, context, page_num,
+                                              image_bytes=image_bytes)
         elif model in ["gpt-4", "gpt-4o", "gpt-4o-mini"]:
-            return call_openai_api_correction(image_path, prompt, prompt_template, context, page_num, model_name=model)
+            return call_openai_api_correction(image_path, prompt, prompt_template, context, page_num,
+                                              model_name=model, image_bytes=image_bytes)
     
     elif api_type == "text":
         # Text-only API calls
@@ -5,112 +5,161 @@ import os
 import hashlib
 import json
 from pathlib import Path
-from dotenv import load_dotenv
+
+# Project paths, resolved once at import
+PROJECT_ROOT = Path(__file__).parent.parent if __name__ != "__main__" else Path(__file__).parent
+ENV_PATH = PROJECT_ROOT / ".env"
+
+# Streamlit module, resolved once on first use
+_ST = None
+_ST_CHECKED = False
+
+# Set once load_configuration() has populated os.environ
+_LOADED = False
+
+# Which section of Streamlit secrets each variable lives in
+_DB_KEYS = frozenset({'SUPABASE_URL', 'SUPABASE_ANON_KEY', 'SUPABASE_SERVICE_KEY', 'ENABLE_SUPABASE'})
+_API_KEYS = frozenset({'OPENAI_API_KEY', 'MISTRAL_API_KEY', 'GOOGLE_API_KEY'})
+
+# Configuration mapping (variable name -> default value)
+CONFIG_VARS = {
+    # Database configuration
+    'SUPABASE_URL': None,
+    'SUPABASE_ANON_KEY': None,
+    'SUPABASE_SERVICE_KEY': None,
+    'ENABLE_SUPABASE': 'false',
+    
+    # API Keys
+    'OPENAI_API_KEY': None,
+    'MISTRAL_API_KEY': None,
+    'GOOGLE_API_KEY': None,
+}
+
+# Variables reported by get_config_status()
+STATUS_VARS = (
+    'SUPABASE_URL', 'SUPABASE_ANON_KEY', 'ENABLE_SUPABASE',
+    'OPENAI_API_KEY', 'MISTRAL_API_KEY', 'GOOGLE_API_KEY'
+)
 
 # Import streamlit only when needed to avoid issues in non-Streamlit contexts
 def get_streamlit():
     """Safely import and return streamlit, or None if not available"""
+    global _ST, _ST_CHECKED
+    if not _ST_CHECKED:
+        try:
+            import streamlit as st
+            _ST = st
+        except ImportError:
+            _ST = None
+        _ST_CHECKED = True
+    return _ST
+
+def _resolve_lazy(name):
+    """Import an optional dependency on first use and cache it as a module global"""
+    if name == 'load_dotenv':
+        from dotenv import load_dotenv as value
+    elif name == 'st':
+        value = get_streamlit()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __getattr__(name):
+    """Expose `load_dotenv` and `st` lazily (PEP 562)"""
+    return _resolve_lazy(name)
+
+def _no_secret(var_name):
+    return None
+
+def _get_secret_getters(st):
+    """
+    Probe Streamlit secrets once and return lookup functions for the
+    "database" and "api_keys" sections (no-ops when secrets are unavailable)
+    """
+    if st is None:
+        return _no_secret, _no_secret
     try:
-        import streamlit as st
-        return st
-    except ImportError:
-        return None
+        return st.secrets.get("database", {}).get, st.secrets.get("api_keys", {}).get
+    except Exception:
+        return _no_secret, _no_secret
 
-def load_configuration():
+def load_configuration(force=False):
     """
     Load configuration from multiple sources in order of priority:
     1. Streamlit secrets (for deployed apps)
     2. Environment variables (for containers/hosting)
     3. .env file (for local development)
+    
+    Subsequent calls are no-ops unless force=True.
     """
+    global _LOADED
+    if _LOADED and not force:
+        return True
     
     # First, try to load from .env file (local development)
-    project_root = Path(__file__).parent.parent if __name__ != "__main__" else Path(__file__).parent
-    env_path = project_root / ".env"
-    if env_path.exists():
-        load_dotenv(env_path, override=False)  # Don't override existing vars
-    
-    # Configuration mapping
-    config_vars = {
-        # Database configuration
-        'SUPABASE_URL': None,
-        'SUPABASE_ANON_KEY': None,
-        'SUPABASE_SERVICE_KEY': None,
-        'ENABLE_SUPABASE': 'false',
-        
-        # API Keys
-        'OPENAI_API_KEY': None,
-        'MISTRAL_API_KEY': None,
-        'GOOGLE_API_KEY': None,
-    }
+    if ENV_PATH.exists():
+        # Only pay for python-dotenv when there is a file to read
+        load_dotenv = globals().get('load_dotenv') or _resolve_lazy('load_dotenv')
+        load_dotenv(ENV_PATH, override=False)  # Don't override existing vars
     
-    # Get streamlit safely
-    st = get_streamlit()
+    # Get streamlit secrets lookups safely
+    db_get, api_get = _get_secret_getters(get_streamlit())
     
     # Load configuration from various sources
-    for var_name in config_vars.keys():
+    resolved = {}
+    for var_name, default in CONFIG_VARS.items():
         value = None
         
         # 1. Try Streamlit secrets first (for deployed apps)
-        if st is not None:
-            try:
-                if hasattr(st, 'secrets'):
-                    if var_name in ['SUPABASE_URL', 'SUPABASE_ANON_KEY', 'SUPABASE_SERVICE_KEY', 'ENABLE_SUPABASE']:
-                        value = st.secrets.get("database", {}).get(var_name)
-                    elif var_name in ['OPENAI_API_KEY', 'MISTRAL_API_KEY', 'GOOGLE_API_KEY']:
-                        value = st.secrets.get("api_keys", {}).get(var_name)
-            except Exception:
-                pass
+        if var_name in _DB_KEYS:
+            value = db_get(var_name)
+        elif var_name in _API_KEYS:
+            value = api_get(var_name)
         
         # 2. Fall back to environment variables
         if not value:
-            value = os.getenv(var_name, config_vars[var_name])
+            value = os.getenv(var_name, default)
         
-        # 3. Set the environment variable for other modules to use
         if value:
-            os.environ[var_name] = str(value)
+            resolved[var_name] = value if isinstance(value, str) else str(value)
+    
+    # 3. Set the environment variables for other modules to use
+    os.environ.update(resolved)
     
+    _LOADED = True
     return True
 
 def get_config_status():
     """Get the current configuration status for debugging"""
     status = {}
     
-    # Get streamlit safely
-    st = get_streamlit()
+    # Get streamlit secrets lookups safely (fetched once instead of per variable)
+    db_get, api_get = _get_secret_getters(get_streamlit())
     
-    vars_to_check = [
-        'SUPABASE_URL', 'SUPABASE_ANON_KEY', 'ENABLE_SUPABASE',
-        'OPENAI_API_KEY', 'MISTRAL_API_KEY', 'GOOGLE_API_KEY'
-    ]
+    env_snap = os.environ
+    env_file_present = None
     
-    for var in vars_to_check:
-        value = os.getenv(var)
+    for var in STATUS_VARS:
+        value = env_snap.get(var)
         status[var] = {
             'set': bool(value),
             'source': 'unknown'
         }
         
         # Try to determine source
-        if st is not None and hasattr(st, 'secrets'):
-            try:
-                if var in ['SUPABASE_URL', 'SUPABASE_ANON_KEY', 'SUPABASE_SERVICE_KEY', 'ENABLE_SUPABASE']:
-                    if st.secrets.get("database", {}).get(var):
-                        status[var]['source'] = 'streamlit_secrets'
-                elif var in ['OPENAI_API_KEY', 'MISTRAL_API_KEY', 'GOOGLE_API_KEY']:
-                    if st.secrets.get("api_keys", {}).get(var):
-                        status[var]['source'] = 'streamlit_secrets'
-            except Exception:
-                pass
+        if var in _DB_KEYS:
+            if db_get(var):
+                status[var]['source'] = 'streamlit_secrets'
+        elif var in _API_KEYS:
+            if api_get(var):
+                status[var]['source'] = 'streamlit_secrets'
         
         if status[var]['source'] == 'unknown' and value:
-            # Check if .env file exists
-            project_root = Path(__file__).parent.parent if __name__ != "__main__" else Path(__file__).parent
-            env_path = project_root / ".env"
-            if env_path.exists():
-                status[var]['source'] = 'env_file'
-            else:
-                status[var]['source'] = 'environment'
+            # Check if .env file exists (probed once per call)
+            if env_file_present is None:
+                env_file_present = ENV_PATH.exists()
+            status[var]['source'] = 'env_file' if env_file_present else 'environment'
     
     return status
 
@@ -4,10 +4,21 @@ import logging
 import re
 from .api_calls import call_api_for_model, extract_content_from_response
 from .text_processing import calculate_text_difference
-from .data_utils import save_extracted_text
+from .data_utils import save_extracted_text, ensure_dir, write_text_atomic
 
 logger = logging.getLogger(__name__)
 
+def best_text_path(output_dirs, page_num):
+    """Path of the file holding a page's OCR text once adaptive correction has finished."""
+    return os.path.join(os.path.dirname(output_dirs["ocr"]), "ocr_best", f"page_{page_num}.txt")
+
+def _load_image_bytes(image_path, image_bytes):
+    """Return image_bytes, reading the page image only if it has not been loaded yet."""
+    if image_bytes is None:
+        with open(image_path, 'rb') as f:
+            image_bytes = f.read()
+    return image_bytes
+
 def perform_ocr_with_adaptive_correction(
     image_path, 
     page_num, 
@@ -38,11 +49,14 @@ def perform_ocr_with_adaptive_correction(
     Returns:
         The final corrected text
     """
+    # Page image, read once on first use and shared by the OCR and correction calls
+    image_bytes = None
+    
     # Extract the OCR directory
     ocr_dir = output_dirs.get("ocr")
     
     # Create the OCR directory if it doesn't exist
-    os.makedirs(ocr_dir, exist_ok=True)
+    ensure_dir(ocr_dir)
     
     # STEP 1: Initial OCR
     ocr_output_file = os.path.join(ocr_dir, f"page_{page_num}_ocr.txt")
@@ -54,7 +68,8 @@ def perform_ocr_with_adaptive_correction(
         if model == "mistral-ocr":
             # Direct call to Mistral OCR without prompt
             try:
-                ocr_response = call_api_for_model(model, "vision", image_path, "")
+                image_bytes = _load_image_bytes(image_path, image_bytes)
+                ocr_response = call_api_for_model(model, "vision", image_path, "", image_bytes=image_bytes)
                 current_text = extract_content_from_response(ocr_response, model)
                 save_extracted_text(current_text, ocr_output_file)
                 logger.info(f"Completed Mistral OCR for {lang} page {page_num}")
@@ -73,7 +88,9 @@ def perform_ocr_with_adaptive_correction(
             
             # Call OCR
             try:
-                ocr_response = call_api_for_model(model, "vision", image_path, ocr_prompt)
+                image_bytes = _load_image_bytes(image_path, image_bytes)
+                ocr_response = call_api_for_model(model, "vision", image_path, ocr_prompt,
+                                                  image_bytes=image_bytes)
                 current_text = extract_content_from_response(ocr_response, model)
                 save_extracted_text(current_text, ocr_output_file)
             except Exception as e:
@@ -83,6 +100,10 @@ def perform_ocr_with_adaptive_correction(
     # Determine max corrections - use fewer passes for Mistral OCR since it's typically more accurate
     max_pass = 2 if model == "mistral-ocr" else max_corrections
     
+    # Loop-invariant path pieces
+    ocr_parent = os.path.dirname(ocr_dir)
+    page_prefix = f"page_{page_num}"
+    
     # Perform correction passes
     for correction_pass in range(1, max_pass + 1):
         # Get the correction directory for this pass
@@ -92,16 +113,16 @@ def perform_ocr_with_adaptive_correction(
         # Skip if this correction directory is not provided
         if not correction_dir:
             # If not specified, create a default directory
-            correction_dir = os.path.join(os.path.dirname(ocr_dir), f"ocr_corrected{correction_pass}")
+            correction_dir = os.path.join(ocr_parent, f"ocr_corrected{correction_pass}")
             output_dirs[correction_dir_key] = correction_dir
         
         # Create the correction directory if it doesn't exist
-        os.makedirs(correction_dir, exist_ok=True)
+        ensure_dir(correction_dir)
             
         # Check if this correction has already been done
         corrected_output_file = os.path.join(
             correction_dir, 
-            f"page_{page_num}_ocr_corrected{correction_pass}.txt"
+            f"{page_prefix}_ocr_corrected{correction_pass}.txt"
         )
         
         if os.path.exists(corrected_output_file):
@@ -116,9 +137,10 @@ def perform_ocr_with_adaptive_correction(
                 context = f"Document: {document_name} ({lang}, Correction {pass_label})"
                 
                 try:
+                    image_bytes = _load_image_bytes(image_path, image_bytes)
                     correction_response = call_api_for_model(
                         correction_model, "correction", image_path, current_text, 
-                        correction_prompt_template, context, page_num
+                        correction_prompt_template, context, page_num, image_bytes=image_bytes
                     )
                     corrected_text = extract_content_from_response(correction_response, correction_model)
                     save_extracted_text(corrected_text, corrected_output_file)
@@ -131,9 +153,10 @@ def perform_ocr_with_adaptive_correction(
                 context = f"Document: {document_name} ({lang}, Correction {pass_label})"
                 
                 try:
+                    image_bytes = _load_image_bytes(image_path, image_bytes)
                     correction_response = call_api_for_model(
                         model, "correction", image_path, current_text, 
-                        correction_prompt_template, context, page_num
+                        correction_prompt_template, context, page_num, image_bytes=image_bytes
                     )
                     corrected_text = extract_content_from_response(correction_response, model)
                     save_extracted_text(corrected_text, corrected_output_file)
@@ -142,7 +165,11 @@ def perform_ocr_with_adaptive_correction(
                     corrected_text = current_text  # Fallback
         
         # Calculate difference between current and corrected text
-        diff_score = calculate_text_difference(current_text, corrected_text)
+        # (identical text, e.g. an unchanged cached pass, needs no edit-distance pass)
+        if corrected_text == current_text:
+            diff_score = 0.0
+        else:
+            diff_score = calculate_text_difference(current_text, corrected_text)
         logger.info(f"{lang} correction {correction_pass} difference score: {diff_score:.4f}")
         
         # Update current text for next iteration
@@ -153,4 +180,7 @@ def perform_ocr_with_adaptive_correction(
             logger.info(f"Minimal changes after {lang} correction {correction_pass} (score: {diff_score:.4f}), stopping corrections")
             break
     
+    # Record the final text only once correction has finished, so an interrupted run
+    # resumes from the per-pass files instead of serving partially corrected text
+    write_text_atomic(current_text, best_text_path(output_dirs, page_num))
     return current_text
\ No newline at end of file
@@ -1,16 +1,47 @@
 """Data handling utilities for file operations and document management"""
 import os
 import re
-import csv
 import json
 import logging
 
+# Optional C-accelerated JSON backend
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Language suffix in a filename (e.g. "catalog_ar.pdf"), matched in a single pass
+_LANG_TOKENS = {
+    "en": "EN", "english": "EN", "eng": "EN",
+    "ar": "AR", "arabic": "AR",
+    "fr": "FR", "french": "FR",
+}
+_LANG_RE = re.compile(r'_(?P<lang>' + '|'.join(_LANG_TOKENS) + r')\.', re.IGNORECASE)
+_EXT_RE = re.compile(r'\.(pdf|jpg|png)$')
+
+# Number of CSV rows formatted in memory before each write
+CSV_FLUSH_ROWS = 512
+
+# Directories already created by this process
+_DIR_CACHE = set()
+
+# Process umask, read once at import (os.umask can only be read by setting it); atomic writes
+# apply it so their files get the same permissions a plain open() would give
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def ensure_dir(directory):
+    """Create a directory once per process, skipping the syscall on later calls."""
+    if directory not in _DIR_CACHE:
+        os.makedirs(directory, exist_ok=True)
+        _DIR_CACHE.add(directory)
+
 def save_extracted_text(text, output_file):
     """Save extracted text to a file for reference."""
     try:
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        ensure_dir(os.path.dirname(output_file))
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(text)
         logger.info(f"Saved extracted text to {output_file}")
@@ -19,86 +50,106 @@ def save_extracted_text(text, output_file):
         logger.error(f"Error saving extracted text: {e}")
         return False
 
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def read_json(input_file):
+    """Load a JSON file, using orjson when it is installed."""
+    with open(input_file, 'rb') as f:
+        return json_loads(f.read())
+
+def write_bytes_atomic(payload, output_file):
+    """Write bytes to a temporary file and move it into place so readers never see a partial file."""
+    import tempfile
+    
+    directory = os.path.dirname(output_file) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        # mkstemp creates the file owner-only (0600)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def json_dumps(data):
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def write_json_atomic(data, output_file):
+    """Write JSON to a temporary file and move it into place so readers never see a partial file."""
+    write_bytes_atomic(json_dumps(data), output_file)
+
+def write_text_atomic(text, output_file):
+    """Write UTF-8 text atomically, creating the directory if needed."""
+    ensure_dir(os.path.dirname(output_file))
+    write_bytes_atomic(text.encode('utf-8'), output_file)
+
 def save_artifacts_to_csv(artifacts, output_file, fieldnames):
     """Save artifacts to a CSV file with proper encoding for multilingual support."""
+    import io
+    import csv
+    
     # Create the directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    ensure_dir(os.path.dirname(output_file))
     
-    # Check if file exists to determine if we need to write header
-    file_exists = os.path.isfile(output_file)
+    # Format rows into a text buffer and write them out as UTF-8 bytes in batches
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
     
-    # Open file with UTF-8 encoding to properly handle multilingual text
-    with open(output_file, 'a', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+    with open(output_file, 'ab', buffering=1 << 20) as csvfile:
+        # Write header only if file is new or empty
+        if os.fstat(csvfile.fileno()).st_size == 0:
+            writer.writerow(fieldnames)
         
-        # Write header only if file is new
-        if not file_exists:
-            writer.writeheader()
-        
-        # Write each artifact as a row
-        for artifact in artifacts:
-            # Create a copy of the artifact to modify
-            row = {k: v for k, v in artifact.items() if k in fieldnames}
-            
-            # Handle missing fields
-            for field in fieldnames:
-                if field not in row:
-                    row[field] = ""
+        for count, artifact in enumerate(artifacts, 1):
+            # Keep only known fields, filling missing ones
+            writer.writerow([artifact.get(field, "") for field in fieldnames])
             
-            # Write the row
-            writer.writerow(row)
+            if count % CSV_FLUSH_ROWS == 0:
+                csvfile.write(buffer.getvalue().encode('utf-8'))
+                buffer.seek(0)
+                buffer.truncate()
+        
+        csvfile.write(buffer.getvalue().encode('utf-8'))
 
 def group_documents_by_language(input_files):
     """Group related documents by language based on filename patterns."""
     document_groups = {}
     
-    # Regular expressions to identify language from filename
-    patterns = {
-        "EN": re.compile(r'(_en\.|_english\.|_eng\.)', re.IGNORECASE),
-        "AR": re.compile(r'(_ar\.|_arabic\.)', re.IGNORECASE),
-        "FR": re.compile(r'(_fr\.|_french\.)', re.IGNORECASE)
-    }
-    
-    # First, categorize each file by language
-    categorized_files = {}
+    # Categorize each file by language directly into its document group
     for input_file in input_files:
         basename = os.path.basename(input_file)
         
         # Determine language from filename
-        detected_lang = None
-        for lang, pattern in patterns.items():
-            if pattern.search(basename):
-                detected_lang = lang
-                break
-        
-        if not detected_lang:
+        match = _LANG_RE.search(basename)
+        if match:
+            detected_lang = _LANG_TOKENS[match.group('lang').lower()]
+            # Get base document name without language suffix
+            base_name = _LANG_RE.sub('.', basename)
+        else:
             # If no language indicator in filename, default to English
             detected_lang = "EN"
-        
-        # Get base document name without language suffix
-        base_name = basename
-        for lang, pattern in patterns.items():
-            base_name = pattern.sub('.', base_name)
+            base_name = basename
         
         # Remove any remaining language indicators and extensions
-        base_name = re.sub(r'\.(pdf|jpg|png)$', '', base_name)
+        base_name = _EXT_RE.sub('', base_name)
         
         # Store under the base document name
-        if base_name not in categorized_files:
-            categorized_files[base_name] = {}
-        
-        categorized_files[base_name][detected_lang] = input_file
+        document_groups.setdefault(base_name, {"EN": None, "AR": None, "FR": None})[detected_lang] = input_file
     
-    # Create complete triplets with all three languages
-    for base_name, lang_files in categorized_files.items():
-        # Only include if we have at least the English version
-        if "EN" in lang_files:
-            document_groups[base_name] = {
-                "EN": lang_files.get("EN"),
-                "AR": lang_files.get("AR"),
-                "FR": lang_files.get("FR")
-            }
-        else:
+    # Only include groups where we have at least the English version
+    for base_name, lang_files in document_groups.items():
+        if lang_files["EN"] is None:
             logger.warning(f"Skipping document group {base_name} - no English version found")
     
-    return document_groups
\ No newline at end of file
+    return {base_name: lang_files for base_name, lang_files in document_groups.items()
+            if lang_files["EN"] is not None}
@@ -1,25 +1,125 @@
 """Artifact and multilingual name extraction functions"""
 import os
+import re
 import json
 import logging
 from .api_calls import call_api_for_model, extract_content_from_response
-from .text_processing import parse_artifacts_from_text, parse_multilingual_names
-from .correction import perform_ocr_with_adaptive_correction
+from .text_processing import parse_artifacts_from_text, parse_multilingual_names, compact
+from .correction import perform_ocr_with_adaptive_correction, best_text_path
+from .data_utils import write_json_atomic, json_loads
+from . import extraction_cache
+from .parallel import run_pages_parallel
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence markers (```json ... ```) at the start or end of a line; only the
+# markers are removed, since a single-line response keeps its JSON on the same line
+_FENCE_RE = re.compile(r'^[^\S\n]*```[a-zA-Z]*|```[^\S\n]*$', re.MULTILINE)
+
+# Fallback pattern for a JSON array of objects embedded in free text
+_JSON_ARRAY_RE = re.compile(r'\[\s*\{.*\}\s*\]', re.DOTALL)
+
+# Upper bound on OCR text characters combined into one batched name-extraction request
+MAX_BATCH_TEXT_CHARS = 60000
+
+def _is_valid_cached_artifacts(cached):
+    """Check that a cached artifact list still has the fields extraction guarantees."""
+    return isinstance(cached, list) and all(
+        isinstance(artifact, dict) and artifact.get("Name") and artifact.get("Category")
+        for artifact in cached
+    )
+
+def _validate_artifacts(artifacts, page_num, document_name):
+    """Keep artifacts that have a name, default a missing category to OTHER, and add source metadata."""
+    if isinstance(artifacts, dict):
+        artifacts = [artifacts]  # A lone object instead of an array
+    
+    source_metadata = {"source_page": page_num, "source_document": document_name}
+    valid_artifacts = []
+    for artifact in artifacts:
+        # Check for required fields (non-object entries have none)
+        if not isinstance(artifact, dict) or not artifact.get("Name"):
+            logger.warning(f"Skipping artifact without name: {artifact}")
+            continue
+        
+        # Ensure it has a category
+        if not artifact.get("Category"):
+            logger.warning(f"Artifact missing category, assigning OTHER: {artifact['Name']}")
+            artifact["Category"] = "OTHER"
+        
+        artifact.update(source_metadata)
+        valid_artifacts.append(artifact)
+    return valid_artifacts
+
+def _loads_outermost_array(raw_content):
+    """Decode the bytes from the first '[' to the last ']', or the whole response if either is missing."""
+    start_idx = raw_content.find(b'[')
+    end_idx = raw_content.rfind(b']')
+    if start_idx != -1 and end_idx != -1:
+        return json_loads(raw_content[start_idx:end_idx + 1])
+    logger.warning(f"Response doesn't contain JSON array markers, attempting full parse")
+    return json_loads(raw_content)
+
+def _parse_artifacts(content, page_num, document_name):
+    """Locate, decode and validate the artifact array in a model response.
+    
+    Returns None when the response contains no JSON at all; raises
+    json.JSONDecodeError when it does but cannot be parsed.
+    """
+    # Prose responses cannot hold artifacts; reject them without raising a JSONDecodeError
+    raw_content = content.encode('utf-8')
+    if b'{' not in raw_content and b'[' not in raw_content:
+        return None
+    
+    try:
+        # Try to extract JSON from a potentially larger text response (scanned once as UTF-8 bytes)
+        artifacts = _loads_outermost_array(raw_content)
+    except json.JSONDecodeError:
+        # Code fences or bracketed prose around the array defeat the outermost-bracket slice
+        if "```" in content:
+            content = _FENCE_RE.sub('', content)
+        json_match = _JSON_ARRAY_RE.search(content)
+        if not json_match:
+            raise
+        artifacts = json_loads(json_match.group(0))
+        logger.info(f"Parsed artifacts for page {page_num} using fallback parser")
+    
+    # Validate artifacts - ensure they have required fields
+    return _validate_artifacts(artifacts, page_num, document_name)
+
 def extract_artifacts_from_page(image_path, page_num, document_name, model, final_corrected_text, 
-                               artifact_prompt_template, results_dir):
-    """Extract artifacts from a page using both text and image."""
+                               artifact_prompt_template, results_dir, cache_dir=None):
+    """Extract artifacts from a page using both text and image.
+    
+    When cache_dir is given, results are cached by model, prompt and image content.
+    """
     logger.info(f"Extracting artifacts from page {page_num}")
     
     # Create the artifact extraction prompt with the corrected text
+    final_corrected_text = compact(final_corrected_text)
     formatted_prompt = artifact_prompt_template.format(
         page_number=page_num,
         context=document_name,
         extracted_text=final_corrected_text
     )
     
+    page_output_file = os.path.join(results_dir, f"page_{page_num}_artifacts.json")
+    
+    cache_key = None
+    if cache_dir:
+        cache_key = extraction_cache.make_key(model, "correction", formatted_prompt, image_path=image_path)
+        cached = extraction_cache.get(cache_dir, cache_key)
+        if cached is not None:
+            if _is_valid_cached_artifacts(cached):
+                for artifact in cached:
+                    artifact["source_page"] = page_num
+                    artifact["source_document"] = document_name
+                write_json_atomic(cached, page_output_file)
+                logger.info(f"Loaded {len(cached)} artifacts for page {page_num} from extraction cache")
+                return cached
+            logger.warning(f"Evicting stale extraction cache entry for page {page_num}")
+            extraction_cache.evict(cache_dir, cache_key)
+    
     # Since we need both image and text processing, use the "correction" API type
     # which is designed to handle both inputs in your API system
     response = call_api_for_model(
@@ -42,41 +142,16 @@ def extract_artifacts_from_page(image_path, page_num, document_name, model, fina
         
         # Parse the artifacts from the response
         try:
-            # First attempt to parse the entire content
-            if '[' in content and ']' in content:
-                # Try to extract JSON from a potentially larger text response
-                start_idx = content.find('[')
-                end_idx = content.rfind(']') + 1
-                json_content = content[start_idx:end_idx]
-                artifacts = json.loads(json_content)
-            else:
-                logger.warning(f"Response doesn't contain JSON array markers, attempting full parse")
-                artifacts = json.loads(content)
-            
-            # Validate artifacts - ensure they have required fields
-            valid_artifacts = []
-            for artifact in artifacts:
-                # Check for required fields
-                if "Name" not in artifact or not artifact.get("Name"):
-                    logger.warning(f"Skipping artifact without name: {artifact}")
-                    continue
-                
-                # Ensure it has a category
-                if "Category" not in artifact or not artifact.get("Category"):
-                    logger.warning(f"Artifact missing category, assigning OTHER: {artifact['Name']}")
-                    artifact["Category"] = "OTHER"
-                
-                # Add source metadata
-                artifact["source_page"] = page_num
-                artifact["source_document"] = document_name
-                
-                # Add to valid artifacts
-                valid_artifacts.append(artifact)
+            valid_artifacts = _parse_artifacts(content, page_num, document_name)
+            if valid_artifacts is None:
+                logger.warning(f"Response for page {page_num} contains no JSON, treating as no artifacts")
+                logger.debug(f"Raw response content: {content[:500]}...")
+                return []
             
             # Save artifacts for this page
-            page_output_file = os.path.join(results_dir, f"page_{page_num}_artifacts.json")
-            with open(page_output_file, 'w', encoding='utf-8') as f:
-                json.dump(valid_artifacts, f, indent=2, ensure_ascii=False)
+            write_json_atomic(valid_artifacts, page_output_file)
+            if cache_key:
+                extraction_cache.put(cache_dir, cache_key, valid_artifacts)
             
             logger.info(f"Extracted {len(valid_artifacts)} artifacts from page {page_num}")
             return valid_artifacts
@@ -91,28 +166,92 @@ def extract_artifacts_from_page(image_path, page_num, document_name, model, fina
         return []
     
 
-def extract_multilingual_names_from_page(image_path, page_num, page_artifacts, document_name, model, lang, 
-                                        name_extraction_prompt, ocr_prompt_template, correction_prompt_template, 
-                                        output_dirs, results_dir, correction_threshold):
-    """Extract artifact names in another language for a specific page."""
-    logger.info(f"Extracting {lang} names for artifacts on page {page_num}: {', '.join([a.get('Name', 'Unknown') for a in page_artifacts])}")
+def load_page_ocr_text(output_dirs, page_num):
+    """Return a page's finished corrected OCR text from disk, or None.
     
-    # First check if OCR text exists, if not, perform OCR
-    ocr_output_file = os.path.join(output_dirs["ocr"], f"page_{page_num}_ocr.txt")
-    ocr_corrected2_file = os.path.join(output_dirs["corrected2"], f"page_{page_num}_ocr_corrected2.txt")
-    ocr_corrected3_file = os.path.join(output_dirs["corrected3"], f"page_{page_num}_ocr_corrected3.txt")
+    Pages without it (interrupted or OCR'd by older runs) go back through
+    perform_ocr_with_adaptive_correction, which resumes from the per-pass files.
+    """
+    try:
+        with open(best_text_path(output_dirs, page_num), 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def parse_name_mappings(content, lang):
+    """Parse a JSON array of name mappings from a model response, or return None."""
+    try:
+        # Clean up the content by removing markdown code block markers
+        # This handles responses with ```json [JSON content] ``` format
+        clean_content = content
+        
+        # Remove markdown code block markers if present
+        if "```" in clean_content:
+            # Strip fence markers at the beginning or end of a line
+            clean_content = _FENCE_RE.sub('', clean_content)
+        
+        # Ensure we have valid JSON
+        raw_content = clean_content.strip().encode('utf-8')
+        if not (raw_content.startswith(b'[') and raw_content.endswith(b']')):
+            # Try to find JSON array in the text
+            start_idx = raw_content.find(b'[')
+            end_idx = raw_content.rfind(b']')
+            if start_idx != -1 and end_idx != -1:
+                raw_content = raw_content[start_idx:end_idx+1]
+        
+        return json_loads(raw_content)
+        
+    except json.JSONDecodeError:
+        logger.error(f"Failed to parse {lang} name mappings from response: {content}")
+        
+        # More aggressive fallback parsing for badly formatted JSON
+        try:
+            # Try to extract JSON using regex
+            json_match = _JSON_ARRAY_RE.search(content)
+            if json_match:
+                name_mappings = json_loads(json_match.group(0))
+                logger.info(f"Parsed {len(name_mappings)} {lang} names using fallback parser")
+                return name_mappings
+        except Exception as fallback_error:
+            logger.error(f"Fallback parsing also failed: {fallback_error}")
+        
+        return None
+
+def save_page_name_mappings(name_mappings, results_dir, page_num, lang):
+    """Save name mappings for a single page."""
+    page_output_file = os.path.join(results_dir, f"page_{page_num}_{lang.lower()}_names.json")
+    write_json_atomic(name_mappings, page_output_file)
+
+def _variant_output_dirs(output_dirs, ocr_variant):
+    """Per-page OCR stage directories for one OCR variant (model and correction threshold)."""
+    variant_dir = os.path.join(os.path.dirname(output_dirs["ocr"]), "ocr_variants", ocr_variant)
+    return {key: os.path.join(variant_dir, os.path.basename(directory)) for key, directory in output_dirs.items()}
+
+def ensure_ocr_text(image_path, page_num, document_name, model, lang, ocr_prompt_template,
+                    correction_prompt_template, output_dirs, correction_threshold, cache_dir=None):
+    """Return OCR text for a page, running OCR only when no cached or on-disk text exists.
     
-    # Try to read existing OCR text
+    When cache_dir is given, OCR text is also cached by image hash, language,
+    OCR model and correction threshold, and the per-page OCR and correction
+    files are kept in a directory for that model and threshold.
+    Returns None if OCR fails.
+    """
+    # Identical page images (covers, boilerplate) reuse OCR text across documents
+    image_digest = None
     ocr_text = None
-    if os.path.exists(ocr_corrected3_file):
-        with open(ocr_corrected3_file, 'r', encoding='utf-8') as f:
-            ocr_text = f.read()
-    elif os.path.exists(ocr_corrected2_file):
-        with open(ocr_corrected2_file, 'r', encoding='utf-8') as f:
-            ocr_text = f.read()
-    elif os.path.exists(ocr_output_file):
-        with open(ocr_output_file, 'r', encoding='utf-8') as f:
-            ocr_text = f.read()
+    if cache_dir:
+        ocr_variant = extraction_cache.ocr_variant(model, correction_threshold)
+        # Files written under other settings must not be resumed (or cached) as this variant's text
+        output_dirs = _variant_output_dirs(output_dirs, ocr_variant)
+        try:
+            image_digest = extraction_cache.image_digest(image_path)
+            ocr_text = extraction_cache.ocr_cache_get(cache_dir, image_digest, lang, ocr_variant)
+        except OSError as e:
+            logger.warning(f"Could not hash {image_path} for OCR cache: {e}")
+    
+    # Try to read existing OCR text (this variant's finished text when cache_dir is given)
+    if ocr_text is None:
+        ocr_text = load_page_ocr_text(output_dirs, page_num)
     
     # If no OCR text exists, perform OCR with correction
     if not ocr_text:
@@ -131,18 +270,40 @@ def extract_multilingual_names_from_page(image_path, page_num, page_artifacts, d
             )
         except Exception as e:
             logger.error(f"Failed to perform OCR for {lang} page {page_num}: {e}")
-            return []
+            return None
+        if image_digest and ocr_text:
+            extraction_cache.ocr_cache_put(cache_dir, image_digest, lang, ocr_variant, ocr_text)
+    
+    return ocr_text
+
+def extract_multilingual_names_from_page(page_num, page_artifacts, document_name, model, lang, 
+                                        name_extraction_prompt, ocr_text, results_dir, cache_dir=None):
+    """Extract artifact names in another language from a page's OCR text.
     
-    # Create the multilingual name extraction prompt
-    prompt_template = name_extraction_prompt.format(
+    OCR text comes from ensure_ocr_text. When cache_dir is given, name
+    mappings are cached by model and prompt.
+    """
+    logger.info(f"Extracting {lang} names for artifacts on page {page_num}: {', '.join([a.get('Name', 'Unknown') for a in page_artifacts])}")
+    
+    # Create the multilingual name extraction prompt with the OCR text
+    prompt = name_extraction_prompt.format(
         artifact_list=page_artifacts,
         target_language=lang,
         page_number=page_num,
-        context=document_name
+        context=document_name,
+        extracted_text=compact(ocr_text)
     )
     
-    # Now replace the {extracted_text} placeholder with the actual OCR text
-    prompt = prompt_template.replace("{extracted_text}", ocr_text)
+    cache_key = None
+    if cache_dir:
+        cache_key = extraction_cache.make_key(model, "text", prompt)
+        cached = extraction_cache.get(cache_dir, cache_key)
+        if isinstance(cached, list):
+            save_page_name_mappings(cached, results_dir, page_num, lang)
+            logger.info(f"Loaded {len(cached)} {lang} names for page {page_num} from extraction cache")
+            return cached
+        if cached is not None:
+            extraction_cache.evict(cache_dir, cache_key)
     
     # Call the API (using text-only since we've already incorporated the OCR text)
     response = call_api_for_model(model, "text", prompt=prompt)
@@ -151,65 +312,119 @@ def extract_multilingual_names_from_page(image_path, page_num, page_artifacts, d
         content = extract_content_from_response(response, model)
         
         # Parse the name mappings from the response
-        try:
-            # Clean up the content by removing markdown code block markers
-            # This handles responses with ```json [JSON content] ``` format
-            clean_content = content
-            
-            # Remove markdown code block markers if present
-            if "```" in clean_content:
-                # Strip any line with ``` at the beginning or end
-                lines = clean_content.split('\n')
-                filtered_lines = []
-                for line in lines:
-                    if line.strip().startswith("```") or line.strip().endswith("```"):
-                        continue
-                    filtered_lines.append(line)
-                clean_content = '\n'.join(filtered_lines)
-            
-            # Ensure we have valid JSON
-            clean_content = clean_content.strip()
-            if not (clean_content.startswith('[') and clean_content.endswith(']')):
-                # Try to find JSON array in the text
-                start_idx = clean_content.find('[')
-                end_idx = clean_content.rfind(']')
-                if start_idx != -1 and end_idx != -1:
-                    clean_content = clean_content[start_idx:end_idx+1]
-            
-            name_mappings = json.loads(clean_content)
-            
-            # Save name mappings for this page
-            page_output_file = os.path.join(results_dir, f"page_{page_num}_{lang.lower()}_names.json")
-            with open(page_output_file, 'w', encoding='utf-8') as f:
-                json.dump(name_mappings, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Extracted {len(name_mappings)} {lang} names from page {page_num}")
-            return name_mappings
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse {lang} name mappings from response: {content}")
-            
-            # More aggressive fallback parsing for badly formatted JSON
-            try:
-                # Try to extract JSON using regex
-                import re
-                json_match = re.search(r'\[\s*\{.*\}\s*\]', content, re.DOTALL)
-                if json_match:
-                    potential_json = json_match.group(0)
-                    name_mappings = json.loads(potential_json)
-                    
-                    # Save name mappings for this page
-                    page_output_file = os.path.join(results_dir, f"page_{page_num}_{lang.lower()}_names.json")
-                    with open(page_output_file, 'w', encoding='utf-8') as f:
-                        json.dump(name_mappings, f, indent=2, ensure_ascii=False)
-                    
-                    logger.info(f"Extracted {len(name_mappings)} {lang} names from page {page_num} (using fallback parser)")
-                    return name_mappings
-            except Exception as fallback_error:
-                logger.error(f"Fallback parsing also failed: {fallback_error}")
-            
+        name_mappings = parse_name_mappings(content, lang)
+        if name_mappings is None:
             return []
+        
+        # Save name mappings for this page
+        save_page_name_mappings(name_mappings, results_dir, page_num, lang)
+        if cache_key:
+            extraction_cache.put(cache_dir, cache_key, name_mappings)
+        
+        logger.info(f"Extracted {len(name_mappings)} {lang} names from page {page_num}")
+        return name_mappings
             
     except Exception as e:
         logger.error(f"Error during {lang} name extraction for page {page_num}: {e}")
-        return []
\ No newline at end of file
+        return []
+
+def _chunk_page_batch(page_batch, max_batch_chars):
+    """Split (page_num, ocr_text, page_artifacts) tuples into chunks under a text budget."""
+    chunk = []
+    chunk_chars = 0
+    for entry in page_batch:
+        text_chars = len(entry[1])
+        if chunk and chunk_chars + text_chars > max_batch_chars:
+            yield chunk
+            chunk = []
+            chunk_chars = 0
+        chunk.append(entry)
+        chunk_chars += text_chars
+    if chunk:
+        yield chunk
+
+def _extract_chunk_names(chunk, document_name, model, lang, name_extraction_prompt, cache_dir=None):
+    """Request names for one batch of (page_num, ocr_text, page_artifacts) pages; returns the mappings or None."""
+    page_nums = [page_num for page_num, _, _ in chunk]
+    logger.info(f"Extracting {lang} names for pages {page_nums} in one request")
+    
+    chunk_artifacts = [artifact for _, _, page_artifacts in chunk for artifact in page_artifacts]
+    page_texts = "\n\n".join(
+        f"<PAGE id={page_num}>\n{compact(ocr_text)}\n</PAGE>" for page_num, ocr_text, _ in chunk
+    )
+    prompt = name_extraction_prompt.format(
+        artifact_list=chunk_artifacts,
+        target_language=lang,
+        page_number=", ".join(str(page_num) for page_num in page_nums),
+        context=document_name,
+        extracted_text=page_texts
+    )
+    
+    cache_key = extraction_cache.make_key(model, "text", prompt) if cache_dir else None
+    name_mappings = extraction_cache.get(cache_dir, cache_key) if cache_key else None
+    
+    if isinstance(name_mappings, list):
+        logger.info(f"Loaded {lang} names for pages {page_nums} from extraction cache")
+        return name_mappings
+    
+    try:
+        response = call_api_for_model(model, "text", prompt=prompt)
+        content = extract_content_from_response(response, model)
+        name_mappings = parse_name_mappings(content, lang)
+    except Exception as e:
+        logger.error(f"Error during {lang} name extraction for pages {page_nums}: {e}")
+        return None
+    
+    if cache_key and isinstance(name_mappings, list):
+        extraction_cache.put(cache_dir, cache_key, name_mappings)
+    return name_mappings
+
+def extract_multilingual_names_from_pages(page_batch, document_name, model, lang, 
+                                          name_extraction_prompt, results_dir, 
+                                          max_batch_chars=MAX_BATCH_TEXT_CHARS, cache_dir=None):
+    """
+    Extract artifact names in another language for several pages with one API call per batch.
+    
+    Args:
+        page_batch: List of (page_num, ocr_text, page_artifacts) tuples
+        document_name: Name of the document
+        model: Model to use for name extraction
+        lang: Language code ("AR", "FR")
+        name_extraction_prompt: Multilingual name extraction prompt
+        results_dir: Directory for per-page name mapping files
+        max_batch_chars: Maximum OCR text characters sent in a single request
+        cache_dir: Optional extraction cache directory (keyed by model and prompt)
+        
+    Returns:
+        Dictionary mapping page number to its list of name mappings
+    """
+    names_by_page = {page_num: [] for page_num, _, _ in page_batch}
+    
+    # Each batch is an independent request, so send them concurrently
+    chunks = list(_chunk_page_batch(page_batch, max_batch_chars))
+    chunk_names = run_pages_parallel(
+        _extract_chunk_names,
+        [(chunk, document_name, model, lang, name_extraction_prompt, cache_dir) for chunk in chunks]
+    )
+    for chunk, name_mappings in zip(chunks, chunk_names):
+        if not isinstance(name_mappings, list):
+            continue
+        
+        # Pages each English name belongs to, used to split the combined response
+        pages_by_name = {}
+        for page_num, _, page_artifacts in chunk:
+            for artifact in page_artifacts:
+                pages_by_name.setdefault(artifact.get("Name", ""), []).append(page_num)
+        
+        # Route each mapping back to the page(s) its English name came from
+        for mapping in name_mappings:
+            if not isinstance(mapping, dict):
+                continue
+            for page_num in pages_by_name.get(mapping.get("English_Name", ""), ()):
+                names_by_page[page_num].append(mapping)
+        
+        for page_num, _, _ in chunk:
+            save_page_name_mappings(names_by_page[page_num], results_dir, page_num, lang)
+            logger.info(f"Extracted {len(names_by_page[page_num])} {lang} names from page {page_num}")
+    
+    return names_by_page
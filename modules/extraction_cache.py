@@ -0,0 +1,148 @@
+"""Content-addressable on-disk cache for model extraction calls"""
+import os
+import json
+import time
+import hashlib
+import logging
+from .data_utils import write_json_atomic, write_text_atomic, ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of cached values changes so stale entries stop matching
+CACHE_VERSION = "1"
+
+def _length_prefixed(hasher, data):
+    """Feed data into the hasher preceded by its 8-byte length so fields cannot run together."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    hasher.update(len(data).to_bytes(8, 'big'))
+    hasher.update(data)
+
+def make_key(model, api_type, prompt, image_path=None):
+    """Build a cache key from the model, call type, prompt text and (optionally) image bytes."""
+    hasher = hashlib.sha256()
+    for part in (CACHE_VERSION, model, api_type, prompt):
+        _length_prefixed(hasher, part)
+    
+    if image_path:
+        with open(image_path, 'rb') as f:
+            _length_prefixed(hasher, f.read())
+    else:
+        _length_prefixed(hasher, b"")
+    
+    return hasher.hexdigest()
+
+def _entry_path(cache_dir, key):
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+def get(cache_dir, key, max_age=None):
+    """Return the cached value for key, or None on a miss.
+    
+    Entries written more than max_age seconds ago count as misses and are removed.
+    A hit records its access time so prune() can drop the least recently used entries.
+    """
+    entry_path = _entry_path(cache_dir, key)
+    try:
+        with open(entry_path, 'r', encoding='utf-8') as f:
+            written_at = os.fstat(f.fileno()).st_mtime
+            if max_age is not None and time.time() - written_at > max_age:
+                stale = True
+            else:
+                stale = False
+                value = json.load(f)
+        if stale:
+            evict(cache_dir, key)
+            return None
+        try:
+            os.utime(entry_path, (time.time(), written_at))
+        except OSError:
+            pass
+        return value
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Discarding unreadable extraction cache entry {key[:16]}...: {e}")
+        evict(cache_dir, key)
+        return None
+
+def put(cache_dir, key, value):
+    """Store value under key."""
+    entry_path = _entry_path(cache_dir, key)
+    try:
+        ensure_dir(os.path.dirname(entry_path))
+        write_json_atomic(value, entry_path)
+    except OSError as e:
+        logger.warning(f"Could not write extraction cache entry {key[:16]}...: {e}")
+
+def evict(cache_dir, key):
+    """Remove the entry for key if present."""
+    try:
+        os.remove(_entry_path(cache_dir, key))
+    except OSError:
+        pass
+
+def prune(cache_dir, size_limit):
+    """Delete least recently used entries until the cache holds at most size_limit bytes."""
+    entries = []
+    total_size = 0
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            entry_path = os.path.join(root, name)
+            try:
+                stat = os.stat(entry_path)
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, entry_path))
+            total_size += stat.st_size
+    
+    if total_size <= size_limit:
+        return
+    
+    entries.sort()
+    for _, size, entry_path in entries:
+        try:
+            os.remove(entry_path)
+        except OSError:
+            continue
+        total_size -= size
+        if total_size <= size_limit:
+            break
+
+def image_digest(image_path):
+    """Return a 128-bit BLAKE2b hex digest of an image file, read through mmap."""
+    import mmap
+    
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(image_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+    return hasher.hexdigest()
+
+def ocr_variant(model, correction_threshold):
+    """Short key for the OCR settings that change the text produced for the same image."""
+    hasher = hashlib.blake2b(digest_size=6)
+    for part in (CACHE_VERSION, model, repr(correction_threshold)):
+        _length_prefixed(hasher, part)
+    return hasher.hexdigest()
+
+def _ocr_entry_path(cache_dir, digest, lang, variant):
+    return os.path.join(cache_dir, "ocr", f"{digest}_{lang.lower()}_{variant}.txt")
+
+def ocr_cache_get(cache_dir, digest, lang, variant):
+    """Return cached OCR text for an image digest, language and OCR settings, or None on a miss."""
+    try:
+        with open(_ocr_entry_path(cache_dir, digest, lang, variant), 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not read OCR cache entry {digest[:16]}...: {e}")
+        return None
+
+def ocr_cache_put(cache_dir, digest, lang, variant, text):
+    """Store OCR text for an image digest, language and OCR settings."""
+    try:
+        write_text_atomic(text, _ocr_entry_path(cache_dir, digest, lang, variant))
+    except OSError as e:
+        logger.warning(f"Could not write OCR cache entry {digest[:16]}...: {e}")
@@ -1,44 +1,157 @@
 """Image processing functions for extracting content from PDFs and images"""
 import os
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from shutil import copy
 import fitz  # PyMuPDF
+from .data_utils import ensure_dir
 
 logger = logging.getLogger(__name__)
 
-def extract_images_from_pdf(pdf_path, output_dir, start_page=1, end_page=None):
-    """Extract images from PDF and save them to the output directory."""
+# Page image rendering defaults: 300 DPI is sufficient for OCR, and JPEG keeps
+# uploads small (PNG remains available for scripts that need lossless images)
+RENDER_DPI = 300
+RENDER_FORMAT = "jpg"
+JPEG_QUALITY = 90
+
+# Page counts keyed by (path, mtime, size) so a PDF is only opened once per version
+_PAGE_COUNT_CACHE = {}
+
+# Rendered page image paths keyed by PDF version, page, output directory and render options,
+# so pages rendered earlier in this process are not rasterized again
+_RENDERED_PAGE_CACHE = {}
+
+def render_page(pdf_path, page_index, output_dir, dpi=RENDER_DPI, fmt=RENDER_FORMAT,
+                 quality=JPEG_QUALITY, grayscale=False):
+    """Render one 0-indexed PDF page to an image file and return (image_path, 1-indexed page number).
+    
+    Opens its own document handle so it can run in a worker process.
+    """
     doc = fitz.open(pdf_path)
+    try:
+        page = doc.load_page(page_index)
+        colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+        pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72), colorspace=colorspace, alpha=False)
+        image_path = os.path.join(output_dir, f"page_{page_index + 1}.{fmt}")
+        if fmt == "png":
+            pix.save(image_path)
+        else:
+            pix.save(image_path, output="jpg", jpg_quality=quality)
+        return image_path, page_index + 1
+    finally:
+        doc.close()
+
+def _rendered_page_key(pdf_path, page_index, output_dir, render_options):
+    """Build the _RENDERED_PAGE_CACHE key for one page render."""
+    stat = os.stat(pdf_path)
+    return (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size, page_index,
+            os.path.abspath(output_dir), *render_options)
+
+def _cached_page_image(key):
+    """Return the cached (image_path, page_num) for a render key if its image is still on disk."""
+    cached = _RENDERED_PAGE_CACHE.get(key)
+    if cached is not None and os.path.exists(cached[0]):
+        return cached
+    return None
+
+def render_page_cached(pdf_path, page_index, output_dir, dpi=RENDER_DPI, fmt=RENDER_FORMAT,
+                       quality=JPEG_QUALITY, grayscale=False):
+    """render_page, reusing an image this process already rendered with the same options."""
+    key = _rendered_page_key(pdf_path, page_index, output_dir, (dpi, fmt, quality, grayscale))
+    cached = _cached_page_image(key)
+    if cached is None:
+        cached = render_page(pdf_path, page_index, output_dir, dpi, fmt, quality, grayscale)
+        _RENDERED_PAGE_CACHE[key] = cached
+    return cached
+
+def pdf_page_count(pdf_path):
+    """Return the number of pages in a PDF, opening the file only when it has changed."""
+    stat = os.stat(pdf_path)
+    key = (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+    total_pages = _PAGE_COUNT_CACHE.get(key)
+    if total_pages is None:
+        doc = fitz.open(pdf_path)
+        total_pages = len(doc)
+        doc.close()
+        _PAGE_COUNT_CACHE[key] = total_pages
+    return total_pages
+
+def pdf_page_range(pdf_path, start_page=1, end_page=None):
+    """Clamp a 1-indexed page range to the document and return (start_page, end_page, total_pages)."""
+    total_pages = pdf_page_count(pdf_path)
     
-    # Handle page range
-    total_pages = len(doc)
     start_page = max(1, min(start_page, total_pages))  # Ensure start page is valid (1-indexed)
-    
     if end_page is None:
         end_page = total_pages
     else:
         end_page = max(start_page, min(end_page, total_pages))  # Ensure end page is valid
+    return start_page, end_page, total_pages
+
+def extract_images_from_pdf(pdf_path, output_dir, start_page=1, end_page=None, dpi=RENDER_DPI,
+                            fmt=RENDER_FORMAT, quality=JPEG_QUALITY, grayscale=False):
+    """Extract images from PDF and save them to the output directory.
+    
+    fmt is "jpg" (lossy, at the given quality) or "png" (lossless); grayscale
+    renders monochrome documents with a third of the bytes.
+    """
+    # Handle page range (pages are rendered from their own handles below)
+    start_page, end_page, total_pages = pdf_page_range(pdf_path, start_page, end_page)
         
     logger.info(f"Processing PDF pages {start_page} to {end_page} (of {total_pages} total pages)")
     
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    ensure_dir(output_dir)
+    
+    render_options = (dpi, fmt, quality, grayscale)
     
+    # Reuse pages already rendered in this process; only the rest are rasterized
     image_paths = []
-    for page_num in range(start_page - 1, end_page):  # Convert to 0-indexed for PyMuPDF
-        page = doc.load_page(page_num)
-        # Higher resolution matrix (600 DPI instead of 300 DPI)
-        pix = page.get_pixmap(matrix=fitz.Matrix(600/72, 600/72))
-        image_path = os.path.join(output_dir, f"page_{page_num + 1}.png")
-        pix.save(image_path)
-        image_paths.append((image_path, page_num + 1))
+    page_keys = {}
+    for page_index in range(start_page - 1, end_page):  # Convert to 0-indexed for PyMuPDF
+        key = _rendered_page_key(pdf_path, page_index, output_dir, render_options)
+        cached = _cached_page_image(key)
+        if cached is not None:
+            image_paths.append(cached)
+        else:
+            page_keys[page_index] = key
+    
+    rendered = None
+    # Rendering is CPU-bound, so spread multi-page ranges across processes. Workers are spawned
+    # rather than forked: the caller usually already runs API and render threads
+    if len(page_keys) > 1:
+        max_workers = min(len(page_keys), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = [
+                    executor.submit(render_page, pdf_path, page_index, output_dir, *render_options)
+                    for page_index in page_keys
+                ]
+                rendered = [future.result() for future in futures]
+        except Exception as e:
+            logger.warning(f"Parallel page rendering failed, rendering sequentially: {e}")
+    if rendered is None:
+        rendered = [render_page(pdf_path, page_index, output_dir, *render_options) for page_index in page_keys]
     
-    doc.close()  # Close the document to free resources
-    return image_paths
+    for key, image_path in zip(page_keys.values(), rendered):
+        _RENDERED_PAGE_CACHE[key] = image_path
+    image_paths.extend(rendered)
+    return sorted(image_paths, key=lambda item: item[1])
 
 def prepare_input_image(input_file, pages_dir):
     """Prepare a single image input file for processing."""
     dest_path = os.path.join(pages_dir, os.path.basename(input_file))
     if not os.path.exists(dest_path):
-        copy(input_file, dest_path)
-    return [(dest_path, 1)]  # Single image with page number 1
\ No newline at end of file
+        if os.path.lexists(dest_path):
+            os.remove(dest_path)  # Dangling link from a moved source image
+        # Link rather than copy the (read-only) source; copy only when linking is not possible
+        linkers = (os.link, os.symlink) if os.name == "nt" else (os.symlink, os.link)
+        for link in linkers:
+            try:
+                link(os.path.abspath(input_file), dest_path)
+                break
+            except (OSError, NotImplementedError):
+                continue
+        else:
+            copy(input_file, dest_path)
+    return [(dest_path, 1)]  # Single image with page number 1
@@ -0,0 +1,27 @@
+"""Helpers for running independent per-page work concurrently"""
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Default number of pages processed at once; page work is dominated by API latency
+DEFAULT_MAX_WORKERS = int(os.getenv("ARTIFACTS_PAGE_CONCURRENCY", "8"))
+
+def run_pages_parallel(fn, page_args, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Call fn(*args) for every tuple in page_args using a thread pool.
+    
+    Results are returned in the same order as page_args. fn is expected to
+    handle its own errors; an exception raised by fn propagates to the caller.
+    """
+    page_args = list(page_args)
+    if not page_args:
+        return []
+    
+    # Nothing to overlap for a single page
+    if max_workers <= 1 or len(page_args) == 1:
+        return [fn(*args) for args in page_args]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(page_args))) as executor:
+        return list(executor.map(lambda args: fn(*args), page_args))
@@ -0,0 +1,66 @@
+"""Producer/consumer pipeline that overlaps PDF page rendering with per-page API work"""
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .image_processing import render_page_cached
+from .parallel import DEFAULT_MAX_WORKERS
+from .data_utils import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Rendered pages allowed to wait for a consumer before rendering pauses
+RENDER_QUEUE_SIZE = 4
+
+# End-of-stream marker passed from the renderer to the consumers
+_END = None
+
+def run_render_pipeline(pdf_path, output_dir, page_nums, fn, fn_args=(),
+                        max_workers=DEFAULT_MAX_WORKERS, queue_size=RENDER_QUEUE_SIZE):
+    """
+    Render PDF pages in a background thread and call fn(image_path, page_num, *fn_args)
+    on worker threads as soon as each page is ready.
+    
+    Returns results in ascending page order. Pages that fail to render are
+    skipped. fn is expected to handle its own errors; unexpected exceptions are
+    logged and the page is skipped so the pipeline keeps draining.
+    """
+    page_nums = sorted(set(page_nums))
+    if not page_nums:
+        return []
+    
+    ensure_dir(output_dir)
+    rendered = queue.Queue(maxsize=queue_size)
+    num_consumers = max(1, min(max_workers, len(page_nums)))
+    results = {}
+    
+    def produce():
+        try:
+            for page_num in page_nums:
+                try:
+                    rendered.put(render_page_cached(pdf_path, page_num - 1, output_dir))
+                except Exception as e:
+                    logger.warning(f"Could not render page {page_num} of {pdf_path}: {e}")
+        finally:
+            for _ in range(num_consumers):
+                rendered.put(_END)
+    
+    def consume():
+        while True:
+            item = rendered.get()
+            if item is _END:
+                return
+            image_path, page_num = item
+            try:
+                results[page_num] = fn(image_path, page_num, *fn_args)
+            except Exception as e:
+                logger.error(f"Error processing page {page_num} in render pipeline: {e}")
+    
+    producer = threading.Thread(target=produce, name="pdf-render", daemon=True)
+    producer.start()
+    with ThreadPoolExecutor(max_workers=num_consumers) as executor:
+        for _ in range(num_consumers):
+            executor.submit(consume)
+    producer.join()
+    
+    return [results[page_num] for page_num in page_nums if page_num in results]
@@ -1,15 +1,26 @@
 """Main document processing functions"""
 import os
-import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from dotenv import load_dotenv
 from pathlib import Path
-from .image_processing import extract_images_from_pdf, prepare_input_image
-from .correction import perform_ocr_with_adaptive_correction
-from .extraction import extract_artifacts_from_page, extract_multilingual_names_from_page
+from .image_processing import (
+    extract_images_from_pdf, prepare_input_image, pdf_page_range, pdf_page_count
+)
+from . import extraction_cache
+from .extraction import (
+    extract_artifacts_from_page, extract_multilingual_names_from_page,
+    extract_multilingual_names_from_pages, ensure_ocr_text
+)
 from .validation import validate_and_complete_multilingual_names
-from .data_utils import save_artifacts_to_csv
+from .data_utils import (
+    save_artifacts_to_csv, write_json_atomic, write_bytes_atomic, json_dumps, read_json, ensure_dir
+)
 from .simple_db import get_simple_db
+from .parallel import run_pages_parallel
+from .pipeline import run_render_pipeline
 import re
 
 # Load configuration using the configuration manager
@@ -26,6 +37,58 @@ except Exception as e:
 
 logger = logging.getLogger(__name__)
 
+# OCR text cached by page image content, shared by every run over a document's directory
+OCR_CACHE_DIRNAME = "ocr_cache"
+
+# Artifact and name extraction results keyed by model and full prompt (which embeds the
+# page's OCR text), so identical re-runs skip the API call
+EXTRACTION_CACHE_DIRNAME = "extraction_cache"
+
+# Per-page English results written by extract_artifacts_from_page
+_PAGE_ARTIFACTS_FILE_RE = re.compile(r'page_(\d+)_artifacts\.json')
+
+# Per-page name mappings written by save_page_name_mappings (page number, language suffix)
+_PAGE_NAMES_FILE_RE = re.compile(r'page_(\d+)_([a-z]+)_names\.json')
+
+# Pages of results saved to the DB per batch in process_multilingual_document_set
+DB_SAVE_BATCH_PAGES = 50
+
+# Artifacts sent per validation call; whole pages are grouped until a batch reaches this size
+VALIDATION_BATCH_ARTIFACTS = 64
+
+# Language suffix stripped from a document stem to get its set's base name
+_LANG_SUFFIX_RE = re.compile(r'_(?:en|ar|fr|english|arabic|french)$', re.IGNORECASE)
+
+# OCR stage keys used by perform_ocr_with_adaptive_correction and their directory names
+_OCR_STAGE_DIRS = (
+    ("ocr", "ocr"),
+    ("corrected1", "ocr_corrected"),
+    ("corrected2", "ocr_corrected2"),
+    ("corrected3", "ocr_corrected3"),
+)
+
+def _setup_lang_dirs(doc_base_dir, lang, results_name):
+    """Create one language's page, OCR-stage and results directories under doc_base_dir.
+    
+    Returns (pages_dir, output_dirs, results_dir), where output_dirs maps OCR stages to directories.
+    """
+    pages_dir = os.path.join(doc_base_dir, lang, "pages")
+    output_dirs = {stage: os.path.join(doc_base_dir, lang, dirname) for stage, dirname in _OCR_STAGE_DIRS}
+    results_dir = os.path.join(doc_base_dir, results_name)
+    for dir_path in (pages_dir, *output_dirs.values(), results_dir):
+        ensure_dir(dir_path)
+    return pages_dir, output_dirs, results_dir
+
+def _list_page_artifact_files(results_dir):
+    """Map page number to its page_{n}_artifacts.json path with a single directory scan."""
+    page_files = {}
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            match = _PAGE_ARTIFACTS_FILE_RE.fullmatch(entry.name)
+            if match:
+                page_files[int(match.group(1))] = entry.path
+    return page_files
+
 def process_english_document(input_file, output_dir, model, start_page=1, end_page=None, 
                             correction_threshold=0.05, ocr_prompt=None, correction_prompt=None, 
                             artifact_prompt=None, ocr_model=None, extraction_model=None):
@@ -37,12 +100,9 @@ def process_english_document(input_file, output_dir, model, start_page=1, end_pa
     # Set up document-specific directories
     pdf_name = os.path.splitext(os.path.basename(input_file))[0]
     doc_base_dir = os.path.join(output_dir, pdf_name)
-    pages_dir = os.path.join(doc_base_dir, "EN", "pages")
-    ocr_dir = os.path.join(doc_base_dir, "EN", "ocr")
-    ocr_corrected_dir = os.path.join(doc_base_dir, "EN", "ocr_corrected")
-    ocr_corrected2_dir = os.path.join(doc_base_dir, "EN", "ocr_corrected2")
-    ocr_corrected3_dir = os.path.join(doc_base_dir, "EN", "ocr_corrected3")
-    results_dir = os.path.join(doc_base_dir, model)
+    pages_dir, output_dirs, results_dir = _setup_lang_dirs(doc_base_dir, "EN", model)
+    ocr_cache_dir = os.path.join(doc_base_dir, OCR_CACHE_DIRNAME)
+    extraction_cache_dir = os.path.join(doc_base_dir, EXTRACTION_CACHE_DIRNAME)
     
     # Log which models are being used
     if actual_ocr_model != model:
@@ -50,81 +110,49 @@ def process_english_document(input_file, output_dir, model, start_page=1, end_pa
     if actual_extraction_model != model:
         logger.info(f"Using {actual_extraction_model} for artifact extraction")
     
-    # Create directories
-    os.makedirs(doc_base_dir, exist_ok=True)
-    os.makedirs(pages_dir, exist_ok=True)
-    os.makedirs(results_dir, exist_ok=True)
-    
     # Document name for source tracking
     document_name = os.path.basename(input_file)
     
-    # Extract pages from the document
-    if input_file.lower().endswith('.pdf'):
+    # Pages in the document (PDF pages are rendered only once they are known to be needed)
+    is_pdf = input_file.lower().endswith('.pdf')
+    if is_pdf:
         logger.info(f"Processing English PDF: {input_file}")
-        image_paths = extract_images_from_pdf(input_file, pages_dir, start_page, end_page)
+        first_page, last_page, total_pages = pdf_page_range(input_file, start_page, end_page)
+        logger.info(f"Processing PDF pages {first_page} to {last_page} (of {total_pages} total pages)")
+        page_nums = list(range(first_page, last_page + 1))
     else:
         logger.info(f"Processing English image: {input_file}")
         image_paths = prepare_input_image(input_file, pages_dir)
+        page_nums = [page_num for _, page_num in image_paths]
+    
+    # Work out which pages still need processing
+    artifacts_by_page = {}
     
-    # Process each page
-    all_artifacts = []
+    # Pages already processed (one directory scan instead of a stat per page)
+    page_result_files = _list_page_artifact_files(results_dir)
     
-    for image_path, page_num in image_paths:
-        logger.info(f"Processing English page {page_num}: {image_path}")
-        
+    for page_num in page_nums:
         # Check if this page has already been processed
-        page_output_file = os.path.join(results_dir, f"page_{page_num}_artifacts.json")
-        if os.path.exists(page_output_file):
+        if page_num in page_result_files:
             logger.info(f"Page {page_num} already processed, loading results")
-            with open(page_output_file, 'r', encoding='utf-8') as f:
-                page_artifacts = json.load(f)
-                all_artifacts.extend(page_artifacts)
-            continue
-        
-        # Set up directories for this page's OCR and correction
-        output_dirs = {
-            "ocr": ocr_dir,
-            "corrected1": ocr_corrected_dir,
-            "corrected2": ocr_corrected2_dir,
-            "corrected3": ocr_corrected3_dir
-        }
-        
-        try:
-            # Perform OCR with adaptive correction using OCR model
-            final_corrected_text = perform_ocr_with_adaptive_correction(
-                image_path=image_path,
-                page_num=page_num,
-                document_name=document_name,
-                model=actual_ocr_model,  # Use OCR-specific model
-                ocr_prompt_template=ocr_prompt,
-                correction_prompt_template=correction_prompt,
-                output_dirs=output_dirs,
-                lang="EN",
-                correction_threshold=correction_threshold
-            )
-            
-            # Extract artifacts using extraction model
-            artifacts = extract_artifacts_from_page(
-                image_path=image_path,
-                page_num=page_num,
-                document_name=document_name,
-                model=actual_extraction_model,  # Use extraction-specific model
-                final_corrected_text=final_corrected_text,
-                artifact_prompt_template=artifact_prompt,
-                results_dir=results_dir
-            )
-            
-            all_artifacts.extend(artifacts)
-            
-        except Exception as e:
-            logger.error(f"Error processing English page {page_num}: {e}")
-            continue
+            artifacts_by_page[page_num] = read_json(page_result_files[page_num])
+    pending_page_nums = [page_num for page_num in page_nums if page_num not in artifacts_by_page]
+    
+    artifacts_by_page.update(_process_english_pages(
+        input_file, pages_dir, pending_page_nums, image_paths if not is_pdf else None, results_dir,
+        (document_name, actual_ocr_model, actual_extraction_model, ocr_prompt, correction_prompt,
+         artifact_prompt, output_dirs, results_dir, correction_threshold, ocr_cache_dir,
+         extraction_cache_dir)
+    ))
+    
+    all_artifacts = [
+        artifact for page_num in sorted(artifacts_by_page) for artifact in artifacts_by_page[page_num]
+    ]
     
     # Save all artifacts
     if all_artifacts:
         all_artifacts_file = os.path.join(results_dir, "english_artifacts.json")
-        with open(all_artifacts_file, 'w', encoding='utf-8') as f:
-            json.dump(all_artifacts, f, indent=2, ensure_ascii=False)
+        write_json_atomic(all_artifacts, all_artifacts_file)
         
         logger.info(f"Processed English document, found {len(all_artifacts)} artifacts")
     else:
@@ -132,6 +160,63 @@ def process_english_document(input_file, output_dir, model, start_page=1, end_pa
     
     return all_artifacts, doc_base_dir
 
+def _extract_lang_page_names(image_path, page_num, page_artifacts, other_lang_file, lang, ocr_model,
+                             extraction_model, ocr_prompt, correction_prompt, name_extraction_prompt,
+                             output_dirs, results_dir, correction_threshold, ocr_cache_dir=None,
+                             extraction_cache_dir=None):
+    """OCR one page of another-language document and extract the names of its artifacts."""
+    logger.info(f"Processing {lang} page {page_num} with {len(page_artifacts)} artifacts")
+    output_dirs = dict(output_dirs)  # Pages running concurrently must not share this dict
+    
+    try:
+        # First ensure we have OCR text for this page (using OCR model)
+        ocr_text = ensure_ocr_text(
+            image_path=image_path,
+            page_num=page_num,
+            document_name=os.path.basename(other_lang_file),
+            model=ocr_model,  # Use OCR-specific model
+            lang=lang,
+            ocr_prompt_template=ocr_prompt,
+            correction_prompt_template=correction_prompt,
+            output_dirs=output_dirs,
+            correction_threshold=correction_threshold,
+            cache_dir=ocr_cache_dir
+        )
+        if ocr_text is None:
+            return []
+        
+        # Extract multilingual names from the page using extraction model
+        logger.info(f"About to extract {lang} names for {len(page_artifacts)} artifacts on page {page_num}")
+        name_mappings = extract_multilingual_names_from_page(
+            page_num=page_num,
+            page_artifacts=page_artifacts,
+            document_name=other_lang_file,
+            model=extraction_model,  # Use extraction-specific model
+            lang=lang,
+            name_extraction_prompt=name_extraction_prompt,
+            ocr_text=ocr_text,
+            results_dir=results_dir,
+            cache_dir=extraction_cache_dir
+        )
+        
+        logger.info(f"Extracted {len(name_mappings)} {lang} name mappings from page {page_num}")
+        if not name_mappings:
+            logger.warning(f"No {lang} name mappings found for page {page_num} - this will result in empty {lang} names")
+        
+        return name_mappings
+        
+    except Exception as e:
+        logger.error(f"Error processing {lang} page {page_num}: {e}")
+        return []
+
+def _load_name_mappings_file(path):
+    """Read a saved page name-mappings file, returning [] if it is unreadable or not a list."""
+    try:
+        existing_mappings = read_json(path)
+    except (OSError, ValueError):
+        return []
+    return existing_mappings if isinstance(existing_mappings, list) else []
+
 def extract_multilingual_names(artifacts_en, other_lang_file, output_dir, model, lang, doc_base_dir, 
                               correction_threshold=0.05, ocr_prompt=None, correction_prompt=None, 
                               name_extraction_prompt=None, ocr_model=None, extraction_model=None):
@@ -157,19 +242,9 @@ def extract_multilingual_names(artifacts_en, other_lang_file, output_dir, model,
     logger.info(f"Extracting {lang} names for {len(artifacts_en)} artifacts (threshold: {correction_threshold:.4f})")
     
     # Set up directories
-    lang_pages_dir = os.path.join(doc_base_dir, lang, "pages")
-    lang_ocr_dir = os.path.join(doc_base_dir, lang, "ocr")
-    lang_ocr_corrected_dir = os.path.join(doc_base_dir, lang, "ocr_corrected")
-    lang_ocr_corrected2_dir = os.path.join(doc_base_dir, lang, "ocr_corrected2")
-    lang_ocr_corrected3_dir = os.path.join(doc_base_dir, lang, "ocr_corrected3")
-    results_dir = os.path.join(doc_base_dir, model)
-    
-    os.makedirs(lang_pages_dir, exist_ok=True)
-    os.makedirs(lang_ocr_dir, exist_ok=True)
-    os.makedirs(lang_ocr_corrected_dir, exist_ok=True)
-    os.makedirs(lang_ocr_corrected2_dir, exist_ok=True)
-    os.makedirs(lang_ocr_corrected3_dir, exist_ok=True)
-    os.makedirs(results_dir, exist_ok=True)
+    lang_pages_dir, output_dirs, results_dir = _setup_lang_dirs(doc_base_dir, lang, model)
+    ocr_cache_dir = os.path.join(doc_base_dir, OCR_CACHE_DIRNAME)
+    extraction_cache_dir = os.path.join(doc_base_dir, EXTRACTION_CACHE_DIRNAME)
     
     # Group artifacts by page
     artifacts_by_page = {}
@@ -181,11 +256,8 @@ def extract_multilingual_names(artifacts_en, other_lang_file, output_dir, model,
             artifacts_by_page[page_num] = []
         artifacts_by_page[page_num].append(artifact)
     
-    # Delete the global result file to force regeneration for current pages
+    # Always rewritten below; current pages come from the extraction cache when nothing changed
     lang_result_file = os.path.join(results_dir, f"{lang.lower()}_names.json")
-    if os.path.exists(lang_result_file):
-        logger.info(f"Deleting existing {lang} names file to force regeneration")
-        os.remove(lang_result_file)
     
     # Extract pages from the document
     if other_lang_file.lower().endswith('.pdf'):
@@ -203,124 +275,89 @@ def extract_multilingual_names(artifacts_en, other_lang_file, output_dir, model,
         logger.info(f"Processing {lang} image: {other_lang_file}")
         image_paths = prepare_input_image(other_lang_file, lang_pages_dir)
     
-    # Set up output directories for OCR and correction
-    output_dirs = {
-        "ocr": lang_ocr_dir,
-        "corrected1": lang_ocr_corrected_dir,
-        "corrected2": lang_ocr_corrected2_dir,
-        "corrected3": lang_ocr_corrected3_dir
-    }
-    
     # Load existing name mappings from all pages not in current processing batch
-    all_name_mappings = []
-    
-    # First load mappings for pages we're not currently processing
-    for filename in os.listdir(results_dir):
-        if filename.startswith("page_") and filename.endswith(f"_{lang.lower()}_names.json"):
-            try:
-                page_num = int(filename.split("_")[1])
-                if page_num not in current_pages:  # Only load if not in current batch
-                    with open(os.path.join(results_dir, filename), 'r', encoding='utf-8') as f:
-                        existing_mappings = json.load(f)
-                        if isinstance(existing_mappings, list):
-                            all_name_mappings.extend(existing_mappings)
-            except (ValueError, json.JSONDecodeError):
-                continue
-    
-    # Process current pages
-    for image_path, page_num in image_paths:
-        if page_num not in artifacts_by_page:
-            continue  # Skip pages with no artifacts
-        
-        page_artifacts = artifacts_by_page[page_num]
-        logger.info(f"Processing {lang} page {page_num} with {len(page_artifacts)} artifacts")
-        
-        # Delete any existing page result file to force regeneration
-        page_output_file = os.path.join(results_dir, f"page_{page_num}_{lang.lower()}_names.json")
-        if os.path.exists(page_output_file):
-            logger.info(f"Deleting existing {lang} names for page {page_num} to force regeneration")
-            os.remove(page_output_file)
-        
-        try:
-            # First ensure we have OCR text for this page
-            ocr_output_file = os.path.join(output_dirs["ocr"], f"page_{page_num}_ocr.txt")
-            if not os.path.exists(ocr_output_file):
-                logger.info(f"Performing OCR for {lang} page {page_num}")
-                # Perform OCR with adaptive correction using OCR model
-                perform_ocr_with_adaptive_correction(
-                    image_path=image_path,
-                    page_num=page_num,
-                    document_name=os.path.basename(other_lang_file),
-                    model=actual_ocr_model,  # Use OCR-specific model
-                    ocr_prompt_template=ocr_prompt,
-                    correction_prompt_template=correction_prompt,
-                    output_dirs=output_dirs,
-                    lang=lang,
-                    correction_threshold=correction_threshold
-                )
-            
-            # Extract multilingual names from the page using extraction model
-            logger.info(f"About to extract {lang} names for {len(page_artifacts)} artifacts on page {page_num}")
-            name_mappings = extract_multilingual_names_from_page(
-                image_path=image_path,
-                page_num=page_num,
-                page_artifacts=page_artifacts,
-                document_name=other_lang_file,
-                model=actual_extraction_model,  # Use extraction-specific model
-                lang=lang,
-                name_extraction_prompt=name_extraction_prompt,
-                ocr_prompt_template=ocr_prompt,
-                correction_prompt_template=correction_prompt,
-                output_dirs=output_dirs,
-                results_dir=results_dir,
-                correction_threshold=correction_threshold
-            )
-            
-            logger.info(f"Extracted {len(name_mappings)} {lang} name mappings from page {page_num}")
-            if not name_mappings:
-                logger.warning(f"No {lang} name mappings found for page {page_num} - this will result in empty {lang} names")
-            
-            all_name_mappings.extend(name_mappings)
-            
-        except Exception as e:
-            logger.error(f"Error processing {lang} page {page_num}: {e}")
-            continue
-    
-    # Save all name mappings
+    # First load mappings for pages we're not currently processing (independent small reads)
+    lang_suffix = lang.lower()
+    with os.scandir(results_dir) as entries:
+        existing_files = [
+            (entry.path,) for entry in entries
+            if (match := _PAGE_NAMES_FILE_RE.fullmatch(entry.name))
+            and match.group(2) == lang_suffix and int(match.group(1)) not in current_pages
+        ]
+    existing_results = run_pages_parallel(_load_name_mappings_file, existing_files)
+    
+    # Process current pages (skipping pages with no artifacts), several at a time
+    page_args = [
+        (image_path, page_num, artifacts_by_page[page_num], other_lang_file, lang, actual_ocr_model,
+         actual_extraction_model, ocr_prompt, correction_prompt, name_extraction_prompt,
+         output_dirs, results_dir, correction_threshold, ocr_cache_dir, extraction_cache_dir)
+        for image_path, page_num in image_paths
+        if page_num in artifacts_by_page
+    ]
+    page_results = run_pages_parallel(_extract_lang_page_names, page_args)
+    all_name_mappings = list(chain.from_iterable(existing_results + page_results))
+    
+    # Save all name mappings (an empty list too, so names from an earlier run are not merged later)
+    write_json_atomic(all_name_mappings, lang_result_file)
     if all_name_mappings:
-        with open(lang_result_file, 'w', encoding='utf-8') as f:
-            json.dump(all_name_mappings, f, indent=2, ensure_ascii=False)
-        
         logger.info(f"Extracted {len(all_name_mappings)} {lang} names")
     else:
         logger.warning(f"No {lang} names extracted")
     
     return all_name_mappings
 
+def _multilingual_record(artifact, en_name, name_ar, name_fr):
+    """Build the multilingual database row for an English artifact and its translated names."""
+    art_get = artifact.get
+    # A dict display (rather than a loop over field names) keeps this hot path cheap and the key order fixed
+    return {
+        "Name_EN": en_name,
+        "Name_AR": name_ar,
+        "Name_FR": name_fr,
+        "Creator": art_get("Creator", ""),
+        "Creation Date": art_get("Creation Date", ""),
+        "Materials": art_get("Materials", ""),
+        "Origin": art_get("Origin", ""),
+        "Description": art_get("Description", ""),
+        "Category": art_get("Category", ""),
+        "source_page": art_get("source_page", ""),
+        "source_document": art_get("source_document", "")
+    }
+
+def _build_name_dict(name_mappings, name_field):
+    """Map English names to their translated names, skipping empty and NOT_FOUND entries."""
+    return {
+        en_name: translated_name
+        for mapping in name_mappings
+        if (en_name := mapping.get("English_Name"))
+        and (translated_name := mapping.get(name_field))
+        and translated_name != "NOT_FOUND"
+    }
+
+# Fields the validation step may rewrite; everything else comes from the pre-validation artifact
+_NAME_FIELDS = frozenset({"Name_EN", "Name_AR", "Name_FR", "Name_validation"})
+
+def _restore_metadata(validated_artifacts, original_artifacts):
+    """Copy non-name fields from the pre-validation artifacts onto their validated counterparts."""
+    if len(validated_artifacts) != len(original_artifacts):
+        return
+    for validated, original in zip(validated_artifacts, original_artifacts):
+        validated.update({key: value for key, value in original.items() if key not in _NAME_FIELDS})
+
 def create_consolidated_database(artifacts_en, ar_name_mappings, fr_name_mappings, output_dir, doc_name, 
                                model, validation_prompt_func, csv_fields):
     """Create a consolidated database with English metadata and multilingual names."""
     logger.info("Creating consolidated multilingual database")
     
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    ensure_dir(output_dir)
     
     # Create mappings for easier lookup
-    ar_name_dict = {}
-    for mapping in ar_name_mappings:
-        en_name = mapping.get("English_Name", "")
-        ar_name = mapping.get("Arabic_Name", "")
-        if en_name and ar_name and ar_name != "NOT_FOUND":
-            ar_name_dict[en_name] = ar_name
+    ar_name_dict = _build_name_dict(ar_name_mappings, "Arabic_Name")
     
     logger.info(f"Created AR name dictionary with {len(ar_name_dict)} mappings")
     
-    fr_name_dict = {}
-    for mapping in fr_name_mappings:
-        en_name = mapping.get("English_Name", "")
-        fr_name = mapping.get("French_Name", "")
-        if en_name and fr_name and fr_name != "NOT_FOUND":
-            fr_name_dict[en_name] = fr_name
+    fr_name_dict = _build_name_dict(fr_name_mappings, "French_Name")
             
     logger.info(f"Created FR name dictionary with {len(fr_name_dict)} mappings")
     
@@ -328,21 +365,24 @@ def create_consolidated_database(artifacts_en, ar_name_mappings, fr_name_mapping
     json_output_file = os.path.join(output_dir, f"{doc_name}_multilingual.json")
     existing_artifacts = {}
     
-    if os.path.exists(json_output_file):
-        try:
-            with open(json_output_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                # Create lookup by English name
-                for item in existing_data:
-                    if "Name_EN" in item:
-                        existing_artifacts[item["Name_EN"]] = item
-        except Exception as e:
-            logger.warning(f"Error loading existing database: {e}")
+    # Every previous artifact is carried into the new database, so the file is always read in full
+    try:
+        # Create lookup by English name
+        existing_artifacts = {
+            item["Name_EN"]: item for item in read_json(json_output_file) if "Name_EN" in item
+        }
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Error loading existing database: {e}")
     
     # Create multilingual artifacts
     multilingual_artifacts = []
     processed_names = set()  # Track names we've processed to avoid duplicates
     
+    ar_get = ar_name_dict.get
+    fr_get = fr_name_dict.get
+    existing_get = existing_artifacts.get
     for artifact in artifacts_en:
         en_name = artifact.get("Name", "")
         if en_name in processed_names:
@@ -350,73 +390,151 @@ def create_consolidated_database(artifacts_en, ar_name_mappings, fr_name_mapping
             
         processed_names.add(en_name)
         
-        # Create multilingual version
-        multilingual_artifact = {
-            "Name_EN": en_name,
-            "Name_AR": ar_name_dict.get(en_name, ""),
-            "Name_FR": fr_name_dict.get(en_name, ""),
-            "Creator": artifact.get("Creator", ""),
-            "Creation Date": artifact.get("Creation Date", ""),
-            "Materials": artifact.get("Materials", ""),
-            "Origin": artifact.get("Origin", ""),
-            "Description": artifact.get("Description", ""),
-            "Category": artifact.get("Category", ""),
-            "source_page": artifact.get("source_page", ""),
-            "source_document": artifact.get("source_document", "")
-        }
+        name_ar = ar_get(en_name, "")
+        name_fr = fr_get(en_name, "")
         
         # If this artifact exists in previous database, use existing translations if available
-        if en_name in existing_artifacts:
-            existing = existing_artifacts[en_name]
-            if not multilingual_artifact["Name_AR"] and existing.get("Name_AR"):
-                multilingual_artifact["Name_AR"] = existing["Name_AR"]
-            if not multilingual_artifact["Name_FR"] and existing.get("Name_FR"):
-                multilingual_artifact["Name_FR"] = existing["Name_FR"]
-            
-            # Remove from existing to track what's been processed
-            del existing_artifacts[en_name]
+        existing = existing_get(en_name)
+        if existing is not None:
+            if not name_ar:
+                name_ar = existing.get("Name_AR") or name_ar
+            if not name_fr:
+                name_fr = existing.get("Name_FR") or name_fr
         
-        multilingual_artifacts.append(multilingual_artifact)
+        # Create multilingual version
+        multilingual_artifacts.append(_multilingual_record(artifact, en_name, name_ar, name_fr))
     
     # Add any remaining existing artifacts that weren't in current batch
-    for _, artifact in existing_artifacts.items():
-        if artifact.get("Name_EN") not in processed_names:
-            multilingual_artifacts.append(artifact)
-            processed_names.add(artifact.get("Name_EN", ""))
-    
-    # Save raw (pre-validation) as JSON for comparison
-    raw_json_output_file = os.path.join(output_dir, f"{doc_name}_multilingual_raw.json")
-    with open(raw_json_output_file, 'w', encoding='utf-8') as f:
-        json.dump(multilingual_artifacts, f, indent=2, ensure_ascii=False)
-    
-    # Validate and complete multilingual names
-    logger.info(f"About to validate {len(multilingual_artifacts)} multilingual artifacts")
-    validated_artifacts = validate_and_complete_multilingual_names(
-        multilingual_artifacts, model, validation_prompt_func
+    multilingual_artifacts.extend(
+        artifact for en_name, artifact in existing_artifacts.items()
+        if en_name not in processed_names
     )
-    logger.info(f"Validation complete. Got {len(validated_artifacts)} validated artifacts")
-    
-    # Ensure all metadata is preserved from raw to validated artifacts
-    if len(validated_artifacts) == len(multilingual_artifacts):
-        for i, validated in enumerate(validated_artifacts):
-            # Copy all metadata fields except name fields, preserving original values
-            for key, value in multilingual_artifacts[i].items():
-                if key not in ["Name_EN", "Name_AR", "Name_FR", "Name_validation"]:
-                    validated[key] = value
-    
-    # Save validated version as JSON
-    with open(json_output_file, 'w', encoding='utf-8') as f:
-        json.dump(validated_artifacts, f, indent=2, ensure_ascii=False)
     
-    # Save as CSV
+    # Save raw (pre-validation) as JSON for comparison; serialize now (validation may update
+    # the artifacts in place) and write the file while the validation calls run
+    raw_json_output_file = os.path.join(output_dir, f"{doc_name}_multilingual_raw.json")
+    raw_payload = json_dumps(multilingual_artifacts)
     csv_output_file = os.path.join(output_dir, f"{doc_name}_multilingual.csv")
-    save_artifacts_to_csv(validated_artifacts, csv_output_file, csv_fields)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        raw_write = executor.submit(write_bytes_atomic, raw_payload, raw_json_output_file)
+        
+        # Validate and complete multilingual names
+        logger.info(f"About to validate {len(multilingual_artifacts)} multilingual artifacts")
+        validated_artifacts = validate_and_complete_multilingual_names(
+            multilingual_artifacts, model, validation_prompt_func
+        )
+        logger.info(f"Validation complete. Got {len(validated_artifacts)} validated artifacts")
+        
+        # Ensure all metadata is preserved from raw to validated artifacts
+        _restore_metadata(validated_artifacts, multilingual_artifacts)
+        
+        # Save validated version as JSON and CSV; the two outputs are independent, so write
+        # them side by side and wait for all files before reporting the database as created
+        json_write = executor.submit(write_json_atomic, validated_artifacts, json_output_file)
+        csv_write = executor.submit(save_artifacts_to_csv, validated_artifacts, csv_output_file, csv_fields)
+        raw_write.result()
+        json_write.result()
+        csv_write.result()
     
     logger.info(f"Created multilingual database with {len(validated_artifacts)} artifacts")
     logger.info(f"Results saved to {json_output_file} and {csv_output_file}")
     
     return validated_artifacts
 
+def _process_english_page(image_path, page_num, document_name, ocr_model, extraction_model,
+                          ocr_prompt, correction_prompt, artifact_prompt, output_dirs, results_dir,
+                          correction_threshold, ocr_cache_dir=None, extraction_cache_dir=None):
+    """Run OCR with adaptive correction and artifact extraction for one English page."""
+    logger.info(f"Processing English page {page_num}: {image_path}")
+    output_dirs = dict(output_dirs)  # Pages running concurrently must not share this dict
+    
+    try:
+        # Perform OCR with adaptive correction (or reuse OCR text for identical page images)
+        final_corrected_text = ensure_ocr_text(
+            image_path=image_path,
+            page_num=page_num,
+            document_name=document_name,
+            model=ocr_model,
+            lang="EN",
+            ocr_prompt_template=ocr_prompt,
+            correction_prompt_template=correction_prompt,
+            output_dirs=output_dirs,
+            correction_threshold=correction_threshold,
+            cache_dir=ocr_cache_dir
+        )
+        if final_corrected_text is None:
+            return []
+        
+        # Extract artifacts
+        return extract_artifacts_from_page(
+            image_path=image_path,
+            page_num=page_num,
+            document_name=document_name,
+            model=extraction_model,
+            final_corrected_text=final_corrected_text,
+            artifact_prompt_template=artifact_prompt,
+            results_dir=results_dir,
+            cache_dir=extraction_cache_dir
+        )
+        
+    except Exception as e:
+        logger.error(f"Error processing English page {page_num}: {e}")
+        return []
+
+def _process_english_pages(input_file, pages_dir, page_nums, image_paths, results_dir, page_args):
+    """Run _process_english_page over several pages at once, returning {page_num: artifacts}.
+    
+    image_paths lists the (image_path, page_num) pairs of non-PDF input. A page whose
+    image is byte-for-byte identical to one already claimed in this run reuses that
+    page's results.
+    """
+    duplicate_pages = {}
+    
+    # Image digests of pages claimed in this run, for duplicate pages; only exact matches
+    # count, since pages differing in a single line of text can look alike at low resolution
+    page_digests = {}
+    page_digests_lock = threading.Lock()
+    
+    def process_page(image_path, page_num):
+        # Reuse the results of an identical earlier page (blank pages, dividers, repeated boilerplate)
+        try:
+            page_digest = extraction_cache.image_digest(image_path)
+        except OSError as e:
+            logger.warning(f"Could not hash page {page_num} for duplicate detection: {e}")
+            page_digest = None
+        if page_digest is not None:
+            with page_digests_lock:
+                duplicate_of = page_digests.get(page_digest)
+                if duplicate_of is not None:
+                    duplicate_pages[page_num] = duplicate_of
+                    return page_num, None
+                page_digests[page_digest] = page_num
+        
+        return page_num, _process_english_page(image_path, page_num, *page_args)
+    
+    # Pages are independent and dominated by API latency, so run several at once; PDF pages
+    # are rendered on a producer thread and processed as soon as each one is ready
+    if input_file.lower().endswith('.pdf'):
+        page_results = run_render_pipeline(input_file, pages_dir, page_nums, process_page)
+    else:
+        wanted_pages = frozenset(page_nums)
+        pending_images = [(image_path, page_num) for image_path, page_num in image_paths
+                          if page_num in wanted_pages]
+        page_results = run_pages_parallel(process_page, pending_images)
+    artifacts_by_page = {page_num: artifacts for page_num, artifacts in page_results if artifacts is not None}
+    
+    # Duplicate pages copy the results of the page they match
+    for page_num, duplicate_of in duplicate_pages.items():
+        logger.info(f"Page {page_num} duplicates page {duplicate_of}, reusing its results")
+        page_artifacts = [
+            {**artifact, "source_page": page_num} for artifact in artifacts_by_page.get(duplicate_of, [])
+        ]
+        # Only record the page as processed if the page it copies was
+        if os.path.exists(os.path.join(results_dir, f"page_{duplicate_of}_artifacts.json")):
+            write_json_atomic(page_artifacts, os.path.join(results_dir, f"page_{page_num}_artifacts.json"))
+        artifacts_by_page[page_num] = page_artifacts
+    return artifacts_by_page
+
 def process_specific_pages_english(input_file, output_dir, model, pages_to_process, 
                                   correction_threshold=0.05, ocr_prompt=None, correction_prompt=None, 
                                   artifact_prompt=None, ocr_model=None, extraction_model=None):
@@ -427,75 +545,23 @@ def process_specific_pages_english(input_file, output_dir, model, pages_to_proce
     # Set up document-specific directories
     pdf_name = os.path.splitext(os.path.basename(input_file))[0]
     doc_base_dir = os.path.join(output_dir, pdf_name)
-    pages_dir = os.path.join(doc_base_dir, "EN", "pages")
-    ocr_dir = os.path.join(doc_base_dir, "EN", "ocr")
-    ocr_corrected_dir = os.path.join(doc_base_dir, "EN", "ocr_corrected")
-    ocr_corrected2_dir = os.path.join(doc_base_dir, "EN", "ocr_corrected2")
-    ocr_corrected3_dir = os.path.join(doc_base_dir, "EN", "ocr_corrected3")
-    results_dir = os.path.join(doc_base_dir, model)
-    
-    # Create directories
-    os.makedirs(doc_base_dir, exist_ok=True)
-    os.makedirs(pages_dir, exist_ok=True)
-    os.makedirs(results_dir, exist_ok=True)
+    pages_dir, output_dirs, results_dir = _setup_lang_dirs(doc_base_dir, "EN", model)
+    ocr_cache_dir = os.path.join(doc_base_dir, OCR_CACHE_DIRNAME)
+    extraction_cache_dir = os.path.join(doc_base_dir, EXTRACTION_CACHE_DIRNAME)
     
     document_name = os.path.basename(input_file)
     
-    # Extract pages from the document (only needed pages)
-    if input_file.lower().endswith('.pdf'):
-        start_page = min(pages_to_process)
-        end_page = max(pages_to_process)
-        image_paths = extract_images_from_pdf(input_file, pages_dir, start_page, end_page)
-    else:
-        image_paths = prepare_input_image(input_file, pages_dir)
-    
-    # Process only the specified pages
-    all_artifacts = []
-    
-    for image_path, page_num in image_paths:
-        if page_num not in pages_to_process:
-            continue  # Skip pages not in our processing list
-            
-        logger.info(f"Processing English page {page_num}: {image_path}")
-        
-        # Set up directories for this page's OCR and correction
-        output_dirs = {
-            "ocr": ocr_dir,
-            "corrected1": ocr_corrected_dir,
-            "corrected2": ocr_corrected2_dir,
-            "corrected3": ocr_corrected3_dir
-        }
-        
-        try:
-            # Perform OCR with adaptive correction
-            final_corrected_text = perform_ocr_with_adaptive_correction(
-                image_path=image_path,
-                page_num=page_num,
-                document_name=document_name,
-                model=actual_ocr_model,
-                ocr_prompt_template=ocr_prompt,
-                correction_prompt_template=correction_prompt,
-                output_dirs=output_dirs,
-                lang="EN",
-                correction_threshold=correction_threshold
-            )
-            
-            # Extract artifacts
-            artifacts = extract_artifacts_from_page(
-                image_path=image_path,
-                page_num=page_num,
-                document_name=document_name,
-                model=actual_extraction_model,
-                final_corrected_text=final_corrected_text,
-                artifact_prompt_template=artifact_prompt,
-                results_dir=results_dir
-            )
-            
-            all_artifacts.extend(artifacts)
-            
-        except Exception as e:
-            logger.error(f"Error processing English page {page_num}: {e}")
-            continue
+    # Render only the needed pages (PDF input), processing each one as soon as it is ready
+    image_paths = None if input_file.lower().endswith('.pdf') else prepare_input_image(input_file, pages_dir)
+    artifacts_by_page = _process_english_pages(
+        input_file, pages_dir, pages_to_process, image_paths, results_dir,
+        (document_name, actual_ocr_model, actual_extraction_model, ocr_prompt, correction_prompt,
+         artifact_prompt, output_dirs, results_dir, correction_threshold, ocr_cache_dir,
+         extraction_cache_dir)
+    )
+    all_artifacts = [
+        artifact for page_num in sorted(artifacts_by_page) for artifact in artifacts_by_page[page_num]
+    ]
     
     logger.info(f"Processed {len(pages_to_process)} pages, found {len(all_artifacts)} artifacts")
     return all_artifacts
@@ -510,17 +576,9 @@ def extract_multilingual_names_for_page(page_artifacts, other_lang_file, page_nu
         # Set up directories for this page's OCR and correction
         pdf_name = os.path.splitext(os.path.basename(other_lang_file))[0]
         doc_base_dir = os.path.join(os.path.dirname(other_lang_file), f"processing_{pdf_name}")
-        lang_pages_dir = os.path.join(doc_base_dir, lang, "pages")
-        lang_ocr_dir = os.path.join(doc_base_dir, lang, "ocr")
-        lang_ocr_corrected_dir = os.path.join(doc_base_dir, lang, "ocr_corrected")
-        lang_ocr_corrected2_dir = os.path.join(doc_base_dir, lang, "ocr_corrected2")
-        lang_ocr_corrected3_dir = os.path.join(doc_base_dir, lang, "ocr_corrected3")
-        results_dir = os.path.join(doc_base_dir, "results")
-        
-        # Create directories
-        for dir_path in [lang_pages_dir, lang_ocr_dir, lang_ocr_corrected_dir, 
-                        lang_ocr_corrected2_dir, lang_ocr_corrected3_dir, results_dir]:
-            os.makedirs(dir_path, exist_ok=True)
+        lang_pages_dir, output_dirs, results_dir = _setup_lang_dirs(doc_base_dir, lang, "results")
+        ocr_cache_dir = os.path.join(doc_base_dir, OCR_CACHE_DIRNAME)
+        extraction_cache_dir = os.path.join(doc_base_dir, EXTRACTION_CACHE_DIRNAME)
         
         # Extract page image if not already done
         if other_lang_file.lower().endswith('.pdf'):
@@ -533,28 +591,32 @@ def extract_multilingual_names_for_page(page_artifacts, other_lang_file, page_nu
         else:
             image_path = other_lang_file
         
-        # Set up output directories
-        output_dirs = {
-            "ocr": lang_ocr_dir,
-            "corrected1": lang_ocr_corrected_dir,
-            "corrected2": lang_ocr_corrected2_dir,
-            "corrected3": lang_ocr_corrected3_dir
-        }
+        ocr_text = ensure_ocr_text(
+            image_path=image_path,
+            page_num=page_num,
+            document_name=os.path.basename(other_lang_file),
+            model=extraction_model,
+            lang=lang,
+            ocr_prompt_template=prompts.get("ocr"),
+            correction_prompt_template=prompts.get("correction"),
+            output_dirs=output_dirs,
+            correction_threshold=correction_threshold,
+            cache_dir=ocr_cache_dir
+        )
+        if ocr_text is None:
+            return []
         
         # Use existing extraction function
         name_mappings = extract_multilingual_names_from_page(
-            image_path=image_path,
             page_num=page_num,
             page_artifacts=page_artifacts,
             document_name=os.path.basename(other_lang_file),
             model=extraction_model,
             lang=lang,
             name_extraction_prompt=prompts.get("multilingual"),
-            ocr_prompt_template=prompts.get("ocr"),
-            correction_prompt_template=prompts.get("correction"),
-            output_dirs=output_dirs,
+            ocr_text=ocr_text,
             results_dir=results_dir,
-            correction_threshold=correction_threshold
+            cache_dir=extraction_cache_dir
         )
         
         logger.info(f"Extracted {len(name_mappings)} {lang} names for page {page_num}")
@@ -564,44 +626,140 @@ def extract_multilingual_names_for_page(page_artifacts, other_lang_file, page_nu
         logger.error(f"Error extracting {lang} names for page {page_num}: {e}")
         return []
 
+def _prepare_lang_page_text(image_path, page_num, artifacts_by_page, other_lang_file, lang,
+                            output_dirs, model, correction_threshold, prompts, ocr_cache_dir=None):
+    """OCR a rendered page of another-language document and return (page_num, ocr_text, page_artifacts), or None."""
+    output_dirs = dict(output_dirs)  # Pages running concurrently must not share this dict
+    try:
+        ocr_text = ensure_ocr_text(
+            image_path=image_path,
+            page_num=page_num,
+            document_name=os.path.basename(other_lang_file),
+            model=model,
+            lang=lang,
+            ocr_prompt_template=prompts.get("ocr"),
+            correction_prompt_template=prompts.get("correction"),
+            output_dirs=output_dirs,
+            correction_threshold=correction_threshold,
+            cache_dir=ocr_cache_dir
+        )
+        if ocr_text is None:
+            return None
+        
+        return page_num, ocr_text, artifacts_by_page[page_num]
+        
+    except Exception as e:
+        logger.error(f"Error preparing {lang} page {page_num} for name extraction: {e}")
+        return None
+
+def extract_multilingual_names_for_pages(artifacts_by_page, other_lang_file, lang,
+                                         ocr_model, extraction_model, correction_threshold, prompts):
+    """Extract multilingual names for artifacts on several pages, batching the name-extraction calls."""
+    names_by_page = {page_num: [] for page_num in artifacts_by_page}
+    if not artifacts_by_page:
+        return names_by_page
+    
+    # Set up directories for OCR and correction
+    pdf_name = os.path.splitext(os.path.basename(other_lang_file))[0]
+    doc_base_dir = os.path.join(os.path.dirname(other_lang_file), f"processing_{pdf_name}")
+    lang_pages_dir, output_dirs, results_dir = _setup_lang_dirs(doc_base_dir, lang, "results")
+    ocr_cache_dir = os.path.join(doc_base_dir, OCR_CACHE_DIRNAME)
+    extraction_cache_dir = os.path.join(doc_base_dir, EXTRACTION_CACHE_DIRNAME)
+    
+    document_name = os.path.basename(other_lang_file)
+    
+    # Gather OCR text for every page first (concurrently) so names can be extracted in one batch;
+    # PDF pages are all rendered up front on one producer thread while earlier pages are OCR'd
+    page_nums = [page_num for page_num, page_artifacts in artifacts_by_page.items() if page_artifacts]
+    ocr_args = (artifacts_by_page, other_lang_file, lang, output_dirs, extraction_model,
+                correction_threshold, prompts, ocr_cache_dir)
+    if other_lang_file.lower().endswith('.pdf'):
+        page_texts = run_render_pipeline(other_lang_file, lang_pages_dir, page_nums, _prepare_lang_page_text,
+                                         fn_args=ocr_args)
+    else:
+        page_texts = run_pages_parallel(
+            _prepare_lang_page_text, [(other_lang_file, page_num, *ocr_args) for page_num in page_nums]
+        )
+    page_batch = [entry for entry in page_texts if entry]
+    
+    if page_batch:
+        names_by_page.update(extract_multilingual_names_from_pages(
+            page_batch=page_batch,
+            document_name=document_name,
+            model=extraction_model,
+            lang=lang,
+            name_extraction_prompt=prompts.get("multilingual"),
+            results_dir=results_dir,
+            cache_dir=extraction_cache_dir
+        ))
+    
+    return names_by_page
+
 def merge_multilingual_names_for_page(page_artifacts, ar_names, fr_names):
     """Merge English artifacts with multilingual names for a specific page."""
     # Create name mappings
-    ar_name_dict = {}
-    for mapping in ar_names:
-        en_name = mapping.get("English_Name", "")
-        ar_name = mapping.get("Arabic_Name", "")
-        if en_name and ar_name and ar_name != "NOT_FOUND":
-            ar_name_dict[en_name] = ar_name
-    
-    fr_name_dict = {}
-    for mapping in fr_names:
-        en_name = mapping.get("English_Name", "")
-        fr_name = mapping.get("French_Name", "")
-        if en_name and fr_name and fr_name != "NOT_FOUND":
-            fr_name_dict[en_name] = fr_name
+    ar_get = _build_name_dict(ar_names, "Arabic_Name").get
+    fr_get = _build_name_dict(fr_names, "French_Name").get
     
     # Merge with English artifacts
     merged_artifacts = []
     for artifact in page_artifacts:
         en_name = artifact.get("Name", "")
-        merged_artifact = {
-            "Name_EN": en_name,
-            "Name_AR": ar_name_dict.get(en_name, ""),
-            "Name_FR": fr_name_dict.get(en_name, ""),
-            "Creator": artifact.get("Creator", ""),
-            "Creation Date": artifact.get("Creation Date", ""),
-            "Materials": artifact.get("Materials", ""),
-            "Origin": artifact.get("Origin", ""),
-            "Description": artifact.get("Description", ""),
-            "Category": artifact.get("Category", ""),
-            "source_page": artifact.get("source_page", ""),
-            "source_document": artifact.get("source_document", "")
-        }
-        merged_artifacts.append(merged_artifact)
+        merged_artifacts.append(_multilingual_record(artifact, en_name, ar_get(en_name, ""), fr_get(en_name, "")))
     
     return merged_artifacts
 
+def _save_json_and_csv(artifacts, json_output_file, csv_output_file, csv_fields):
+    """Write the JSON and CSV outputs for a document set at the same time."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        json_write = executor.submit(write_json_atomic, artifacts, json_output_file)
+        save_artifacts_to_csv(artifacts, csv_output_file, csv_fields)
+        json_write.result()
+
+def _batch_pages_by_artifacts(page_items, batch_size):
+    """Group (page_num, artifacts) pairs into runs of whole pages holding about batch_size artifacts."""
+    batches = []
+    batch = []
+    batch_count = 0
+    for page_num, artifacts in page_items:
+        batch.append((page_num, artifacts))
+        batch_count += len(artifacts)
+        if batch_count >= batch_size:
+            batches.append(batch)
+            batch = []
+            batch_count = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+def _validate_multilingual_batch(batch, extraction_model, validation_prompt=None):
+    """Validate a batch of pages' merged artifacts in one call and split the results back per page."""
+    page_lists = [artifacts for _, artifacts in batch]
+    if not validation_prompt:
+        return page_lists
+    
+    pages = [page_num for page_num, _ in batch]
+    original_artifacts = list(chain.from_iterable(page_lists))
+    try:
+        validated_artifacts = validate_and_complete_multilingual_names(
+            original_artifacts, extraction_model, validation_prompt
+        )
+    except Exception as e:
+        logger.warning(f"Validation failed for pages {pages}, using unvalidated results: {e}")
+        return page_lists
+    
+    # Results are matched back to pages by position, so the model must return one entry per artifact
+    if len(validated_artifacts) != len(original_artifacts):
+        logger.warning(f"Validation returned {len(validated_artifacts)} artifacts for {len(original_artifacts)} "
+                       f"on pages {pages}, using unvalidated results")
+        return page_lists
+    
+    # Ensure all metadata is preserved from original to validated artifacts
+    _restore_metadata(validated_artifacts, original_artifacts)
+    
+    validated_iter = iter(validated_artifacts)
+    return [list(islice(validated_iter, len(artifacts))) for artifacts in page_lists]
+
 def process_multilingual_document_set(doc_group, output_dir, model, start_page=1, end_page=None, 
                                      correction_thresholds=None, prompts=None, csv_fields=None,
                                      ocr_model=None, extraction_model=None, save_to_db=True):
@@ -609,7 +767,7 @@ def process_multilingual_document_set(doc_group, output_dir, model, start_page=1
     # Extract document base name
     base_name = os.path.basename(doc_group.get("EN", ""))
     base_name = os.path.splitext(base_name)[0]
-    base_name = re.sub(r'_(?:en|ar|fr|english|arabic|french)$', '', base_name, flags=re.IGNORECASE)
+    base_name = _LANG_SUFFIX_RE.sub('', base_name)
     
     logger.info(f"Processing multilingual document set: {base_name}")
     
@@ -631,12 +789,8 @@ def process_multilingual_document_set(doc_group, output_dir, model, start_page=1
     
     # Handle None end_page by determining actual document length
     if end_page is None:
-        # Import here to avoid circular import
-        import fitz
         try:
-            doc = fitz.open(en_file)
-            actual_end_page = len(doc)
-            doc.close()
+            actual_end_page = pdf_page_count(en_file)
             logger.info(f"📄 Document has {actual_end_page} pages, processing from {start_page} to end")
         except Exception as e:
             logger.warning(f"Could not determine document length: {e}, using large number")
@@ -665,15 +819,12 @@ def process_multilingual_document_set(doc_group, output_dir, model, start_page=1
         # Save to local files for compatibility
         doc_base_dir = os.path.join(output_dir, base_name)
         results_dir = os.path.join(doc_base_dir, model)
-        os.makedirs(results_dir, exist_ok=True)
+        ensure_dir(results_dir)
         
         json_output_file = os.path.join(results_dir, f"{base_name}_multilingual.json")
         csv_output_file = os.path.join(results_dir, f"{base_name}_multilingual.csv")
         
-        with open(json_output_file, 'w', encoding='utf-8') as f:
-            json.dump(cached_artifacts, f, indent=2, ensure_ascii=False)
-        
-        save_artifacts_to_csv(cached_artifacts, csv_output_file, csv_fields)
+        _save_json_and_csv(cached_artifacts, json_output_file, csv_output_file, csv_fields)
         
         # Save run statistics
         if save_to_db:
@@ -714,86 +865,84 @@ def process_multilingual_document_set(doc_group, output_dir, model, start_page=1
             new_artifacts_by_page[page_num] = []
         new_artifacts_by_page[page_num].append(artifact)
     
-    # Extract names in other languages for missing pages
-    all_new_artifacts = []
+    # Extract names in other languages for missing pages, one batched request per language
+    missing_pages_artifacts = {
+        page_num: new_artifacts_by_page[page_num]
+        for page_num in missing_pages if page_num in new_artifacts_by_page
+    }
     
-    for page_num in missing_pages:
-        if page_num not in new_artifacts_by_page:
-            continue
-            
-        page_artifacts = new_artifacts_by_page[page_num]
-        
-        # Process Arabic names for this page
-        ar_file = doc_group.get("AR")
-        ar_names = []
-        if ar_file:
-            ar_names = extract_multilingual_names_for_page(
-                page_artifacts, ar_file, page_num, "AR",
-                actual_ocr_model, actual_extraction_model,
-                correction_thresholds.get("AR", 0.10),
-                prompts
-            )
-        
-        # Process French names for this page  
-        fr_file = doc_group.get("FR")
-        fr_names = []
-        if fr_file:
-            fr_names = extract_multilingual_names_for_page(
-                page_artifacts, fr_file, page_num, "FR",
-                actual_ocr_model, actual_extraction_model,
-                correction_thresholds.get("FR", 0.07),
-                prompts
-            )
-        
-        # Merge multilingual names for this page
-        page_final_artifacts = merge_multilingual_names_for_page(
-            page_artifacts, ar_names, fr_names
-        )
-        
-        # Apply validation if available
-        if prompts.get("validation"):
-            try:
-                original_artifacts = page_final_artifacts.copy()
-                page_final_artifacts = validate_and_complete_multilingual_names(
-                    page_final_artifacts, actual_extraction_model, prompts.get("validation")
+    # Arabic and French documents are independent, so extract both languages at once
+    lang_thresholds = {"AR": 0.10, "FR": 0.07}
+    lang_files = {lang: doc_group.get(lang) for lang in lang_thresholds if doc_group.get(lang)}
+    names_by_lang = {}
+    if lang_files:
+        with ThreadPoolExecutor(max_workers=len(lang_files)) as executor:
+            lang_futures = {
+                lang: executor.submit(
+                    extract_multilingual_names_for_pages,
+                    missing_pages_artifacts, lang_file, lang,
+                    actual_ocr_model, actual_extraction_model,
+                    correction_thresholds.get(lang, lang_thresholds[lang]),
+                    prompts
                 )
-                
-                # Ensure all metadata is preserved from original to validated artifacts
-                if len(page_final_artifacts) == len(original_artifacts):
-                    for i, validated in enumerate(page_final_artifacts):
-                        # Copy all metadata fields except name fields, preserving original values
-                        for key, value in original_artifacts[i].items():
-                            if key not in ["Name_EN", "Name_AR", "Name_FR", "Name_validation"]:
-                                validated[key] = value
-                                
-            except Exception as e:
-                logger.warning(f"Validation failed for page {page_num}, using unvalidated results: {e}")
-        
-        # Save this page to cache
-        if save_to_db:
-            logger.info(f"💾 Saving page {page_num} to DB with OCR model: {actual_ocr_model}, Extraction model: {actual_extraction_model}")
-            db.save_page_artifacts(
-                doc_group, page_num, page_final_artifacts,
+                for lang, lang_file in lang_files.items()
+            }
+            names_by_lang = {lang: future.result() for lang, future in lang_futures.items()}
+    ar_names_by_page = names_by_lang.get("AR", {})
+    fr_names_by_page = names_by_lang.get("FR", {})
+    
+    # Merge names page by page, then validate pages in batches of about VALIDATION_BATCH_ARTIFACTS
+    # artifacts; batches are independent API calls, so they run at once. Finished pages are saved
+    # to the DB in batches rather than with a lookup and insert per page
+    db_lock = threading.Lock()
+    pending_saves = {}
+    validation_prompt = prompts.get("validation")
+    ar_names_get = ar_names_by_page.get
+    fr_names_get = fr_names_by_page.get
+    merged_pages = [
+        (page_num, merge_multilingual_names_for_page(
+            page_artifacts, ar_names_get(page_num, []), fr_names_get(page_num, [])
+        ))
+        for page_num, page_artifacts in missing_pages_artifacts.items()
+    ]
+    
+    def flush_saves():
+        if pending_saves:
+            logger.info(f"💾 Saving pages {sorted(pending_saves)} to DB with OCR model: {actual_ocr_model}, Extraction model: {actual_extraction_model}")
+            db.save_pages_artifacts(
+                doc_group, dict(pending_saves),
                 actual_ocr_model, actual_extraction_model, correction_thresholds
             )
+            pending_saves.clear()
+    
+    def finalize_batch(batch):
+        page_results = _validate_multilingual_batch(batch, actual_extraction_model, validation_prompt)
         
-        all_new_artifacts.extend(page_final_artifacts)
+        # Queue these pages for the cache, flushing periodically so a crash loses little work
+        if save_to_db:
+            with db_lock:
+                for (page_num, _), page_final_artifacts in zip(batch, page_results):
+                    pending_saves[page_num] = page_final_artifacts
+                if len(pending_saves) >= DB_SAVE_BATCH_PAGES:
+                    flush_saves()
+        return page_results
+    
+    batches = _batch_pages_by_artifacts(merged_pages, VALIDATION_BATCH_ARTIFACTS)
+    batch_results = run_pages_parallel(finalize_batch, [(batch,) for batch in batches])
+    flush_saves()
     
-    # Combine cached and new artifacts
-    final_artifacts = cached_artifacts + all_new_artifacts
+    # Combine cached and new artifacts into a single list (it is written twice and returned)
+    final_artifacts = list(chain(cached_artifacts, chain.from_iterable(chain.from_iterable(batch_results))))
     
     # Save to local files
     doc_base_dir = os.path.join(output_dir, base_name) 
     results_dir = os.path.join(doc_base_dir, model)
-    os.makedirs(results_dir, exist_ok=True)
+    ensure_dir(results_dir)
     
     json_output_file = os.path.join(results_dir, f"{base_name}_multilingual.json")
     csv_output_file = os.path.join(results_dir, f"{base_name}_multilingual.csv")
     
-    with open(json_output_file, 'w', encoding='utf-8') as f:
-        json.dump(final_artifacts, f, indent=2, ensure_ascii=False)
-    
-    save_artifacts_to_csv(final_artifacts, csv_output_file, csv_fields)
+    _save_json_and_csv(final_artifacts, json_output_file, csv_output_file, csv_fields)
     
     # Save run statistics
     if save_to_db:
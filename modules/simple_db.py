@@ -3,12 +3,17 @@ Simple database client for artifact caching
 """
 import os
 import json
+import mmap
 import hashlib
 import logging
-from typing import List, Dict, Optional
+import threading
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 from pathlib import Path
+from .parallel import run_pages_parallel
+from . import extraction_cache
 
 # Conditional streamlit import to avoid issues when not available
 try:
@@ -32,12 +37,93 @@ except Exception as e:
 
 logger = logging.getLogger(__name__)
 
+# Read size for hashing source files when hashlib.file_digest is unavailable (Python < 3.11)
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed through mmap instead of buffered reads
+MMAP_HASH_MIN_SIZE = 4 << 20
+
+# Page cache keys per IN query (keeps request URLs a reasonable length)
+CACHE_LOOKUP_BATCH_SIZE = 100
+
+# Rows requested per page of an IN query's results; must not exceed the PostgREST max-rows
+# setting (1000 on Supabase by default), since a short page is taken as the last one
+CACHE_LOOKUP_PAGE_ROWS = 1000
+
+# Opt-in local copy of cached pages, checked before Supabase so warm re-runs need no round trip
+# (set ARTIFACTS_LOCAL_PAGE_CACHE to a directory to enable). Each Supabase project gets its own
+# subdirectory; entries older than the TTL are fetched from Supabase again, and the least
+# recently used ones are pruned past the size limit
+LOCAL_PAGE_CACHE_DIR = os.getenv("ARTIFACTS_LOCAL_PAGE_CACHE", "")
+LOCAL_PAGE_CACHE_TTL = int(os.getenv("ARTIFACTS_LOCAL_PAGE_CACHE_TTL", str(7 * 24 * 3600)))
+LOCAL_PAGE_CACHE_SIZE_LIMIT = int(os.getenv("ARTIFACTS_LOCAL_PAGE_CACHE_SIZE", str(1 << 30)))
+
+@lru_cache(maxsize=256)
+def _hash_file_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    """SHA-256 of a file's content, memoized per file version (mtime and size are part of the key)"""
+    with open(file_path, 'rb') as f:
+        # Large files are mapped and hashed in one update, letting the OS page them in
+        if size >= MMAP_HASH_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        hasher = hashlib.sha256()
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            chunk_size = f.readinto(buffer)
+            if not chunk_size:
+                break
+            hasher.update(view[:chunk_size])
+    return hasher.hexdigest()
+
+def _canonical_json(data) -> str:
+    """Serialize data the way stored cache keys and parameter hashes were built
+    
+    These bytes feed keys persisted in the database, so the format (stdlib json,
+    sorted keys, default separators and ASCII escaping) must not change.
+    """
+    return json.dumps(data, sort_keys=True)
+
+def _processing_params_hash(thresholds: dict) -> str:
+    """SHA-256 of the canonical thresholds JSON, stored with each saved artifact and run"""
+    return hashlib.sha256(_canonical_json(thresholds).encode()).hexdigest()
+
+# Artifact fields and the artifacts table columns they are stored in
+_ARTIFACT_COLUMNS = (
+    ("Name_EN", "name_en"),
+    ("Name_AR", "name_ar"),
+    ("Name_FR", "name_fr"),
+    ("Creator", "creator"),
+    ("Creation Date", "creation_date"),
+    ("Materials", "materials"),
+    ("Origin", "origin"),
+    ("Description", "description"),
+    ("Category", "category"),
+    ("source_page", "source_page"),
+    ("source_document", "source_document"),
+    ("Name_validation", "name_validation"),
+)
+
+# Columns fetched when reading artifacts back (the row metadata and cache bookkeeping are not needed)
+_ARTIFACT_SELECT = ",".join(("page_cache_key", "page_number") + tuple(column for _, column in _ARTIFACT_COLUMNS))
+
+def _record_to_artifact(record: dict, default_page) -> dict:
+    """Convert an artifacts table row back to the artifact format used by the pipeline"""
+    get = record.get
+    artifact = {field: get(column, "") for field, column in _ARTIFACT_COLUMNS}
+    if "source_page" not in record:
+        artifact["source_page"] = default_page
+    return artifact
+
 class SimpleArtifactDB:
     """Simple database client for artifact storage and caching"""
     
     def __init__(self):
         self.supabase_client = None
         self.enabled = False
+        self.local_cache_dir = None
         
         # Try to initialize Supabase
         try:
@@ -52,7 +138,14 @@ class SimpleArtifactDB:
             if url and key and enable == "true":
                 from supabase import create_client
                 self.supabase_client = create_client(url, key)
+                # Build the PostgREST client (and its pooled HTTP session) now rather than
+                # lazily from whichever worker thread makes the first query
+                getattr(self.supabase_client, "postgrest", None)
                 self.enabled = True
+                if LOCAL_PAGE_CACHE_DIR:
+                    # Keep pages from different Supabase projects apart
+                    project = hashlib.sha256(url.rstrip("/").encode()).hexdigest()[:16]
+                    self.local_cache_dir = os.path.join(os.path.expanduser(LOCAL_PAGE_CACHE_DIR), project)
                 logger.info("✅ Simple database client initialized")
             else:
                 logger.info(f"📝 Database disabled - URL: {bool(url)}, KEY: {bool(key)}, ENABLE: {enable}")
@@ -64,11 +157,8 @@ class SimpleArtifactDB:
     def _hash_file(self, file_path: str) -> str:
         """Generate SHA-256 hash of file content"""
         try:
-            hasher = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            stat = os.stat(file_path)
+            return _hash_file_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             logger.error(f"Error hashing file {file_path}: {e}")
             return ""
@@ -142,58 +232,48 @@ class SimpleArtifactDB:
             cached_artifacts = []
             missing_pages = []
             
-            # Create processing params hash
-            processing_params_hash = hashlib.sha256(
-                json.dumps(thresholds, sort_keys=True).encode()
-            ).hexdigest()
-            
             logger.info(f"🔍 Checking cache for pages {start_page}-{end_page}")
             logger.info(f"🔍 Cache check parameters: OCR={ocr_model}, Extract={extraction_model}")
             
-            for page_num in requested_pages:
-                # Create page cache key
-                page_cache_key = self._create_page_cache_key(
-                    doc_group, page_num, ocr_model, extraction_model, thresholds
-                )
-                
-                # Check if this page exists in cache
-                try:
-                    result = self.supabase_client.rpc("check_page_cache", {
-                        "p_page_cache_key": page_cache_key
-                    }).execute()
-                except Exception as rpc_error:
-                    logger.warning(f"⚠️ RPC call failed for page {page_num}, falling back to direct query: {rpc_error}")
-                    # Fallback to direct table query
-                    result = self.supabase_client.table("artifacts").select("*").eq(
-                        "page_cache_key", page_cache_key
-                    ).execute()
-                
-                if result.data:
+            # Create page cache keys
+            page_cache_key = self._page_key_builder(doc_group, ocr_model, extraction_model, thresholds)
+            page_cache_keys = {page_num: page_cache_key(page_num) for page_num in requested_pages}
+            
+            # Pages already copied locally skip the network entirely
+            local_pages = {}
+            if self.local_cache_dir:
+                for page_num, page_cache_key in page_cache_keys.items():
+                    page_artifacts = extraction_cache.get(
+                        self.local_cache_dir, page_cache_key, max_age=LOCAL_PAGE_CACHE_TTL
+                    )
+                    if page_artifacts:
+                        local_pages[page_num] = page_artifacts
+            
+            # Look up the remaining pages' rows in Supabase, many pages per query, bucketed by page cache key
+            records_by_key = {}
+            all_keys = [key for page_num, key in page_cache_keys.items() if page_num not in local_pages]
+            for record in self._select_by_page_cache_keys(_ARTIFACT_SELECT, all_keys):
+                records_by_key.setdefault(record.get("page_cache_key"), []).append(record)
+            
+            # Rows were fetched page by page until exhausted, so each page's set is complete
+            remote_pages = {}
+            for page_num, page_cache_key in page_cache_keys.items():
+                page_artifacts = local_pages.get(page_num)
+                page_records = records_by_key.get(page_cache_key)
+                if page_artifacts is None and page_records:
                     # Convert database format back to original format
-                    page_artifacts = []
-                    for record in result.data:
-                        artifact = {
-                            "Name_EN": record.get("name_en", ""),
-                            "Name_AR": record.get("name_ar", ""),
-                            "Name_FR": record.get("name_fr", ""),
-                            "Creator": record.get("creator", ""),
-                            "Creation Date": record.get("creation_date", ""),
-                            "Materials": record.get("materials", ""),
-                            "Origin": record.get("origin", ""),
-                            "Description": record.get("description", ""),
-                            "Category": record.get("category", ""),
-                            "source_page": record.get("source_page", page_num),
-                            "source_document": record.get("source_document", ""),
-                            "Name_validation": record.get("name_validation", "")
-                        }
-                        page_artifacts.append(artifact)
-                    
+                    page_artifacts = [_record_to_artifact(record, page_num) for record in page_records]
+                    remote_pages[page_cache_key] = page_artifacts
+                
+                if page_artifacts:
                     cached_artifacts.extend(page_artifacts)
                     logger.info(f"✅ Cache HIT - Page {page_num}: Found {len(page_artifacts)} cached artifacts")
                 else:
                     missing_pages.append(page_num)
                     logger.info(f"❌ Cache MISS - Page {page_num}: Needs processing")
             
+            self._store_local_pages(remote_pages)
+            
             cache_stats = {
                 "cached_pages": len(requested_pages) - len(missing_pages),
                 "missing_pages": len(missing_pages),
@@ -212,15 +292,22 @@ class SimpleArtifactDB:
                 end_page = 9999
             return [], list(range(start_page, end_page + 1)), {"cached_pages": 0, "missing_pages": end_page - start_page + 1}
     
-    def _create_page_cache_key(self, doc_group: dict, page_num: int, ocr_model: str, 
-                              extraction_model: str, thresholds: dict) -> str:
-        """Create unique cache key using content fingerprints instead of file paths"""
+    def _doc_content_hashes(self, doc_group: dict) -> Dict[str, str]:
+        """Fingerprint each document in a group for page cache keys"""
         content_hashes = {}
         
+        # Use content fingerprints for fast, reliable identification; the files are
+        # independent, so read them at once
+        local_files = [(lang, file_path) for lang, file_path in doc_group.items()
+                       if file_path and os.path.exists(file_path)]
+        fingerprints = run_pages_parallel(
+            self._create_content_fingerprint, [(file_path,) for _, file_path in local_files]
+        )
+        local_hashes = {lang: fingerprint for (lang, _), fingerprint in zip(local_files, fingerprints)}
+        
         for lang, file_path in doc_group.items():
-            if file_path and os.path.exists(file_path):
-                # Use content fingerprint for fast, reliable identification
-                content_hashes[lang] = self._create_content_fingerprint(file_path)
+            if lang in local_hashes:
+                content_hashes[lang] = local_hashes[lang]
             else:
                 # Fallback to original filename from session state
                 try:
@@ -235,20 +322,42 @@ class SimpleArtifactDB:
                 except Exception:
                     content_hashes[lang] = "missing"
         
-        # Create parameter combination
-        params = {
-            'content_hashes': content_hashes,
-            'page': page_num,
-            'ocr_model': ocr_model,
+        return content_hashes
+    
+    def _page_key_builder(self, doc_group: dict, ocr_model: str, extraction_model: str,
+                          thresholds: dict) -> Callable[[int], str]:
+        """Return a function mapping a page number to its page cache key
+        
+        The document fingerprints and parameters are serialized and hashed once; each
+        page only hashes its number and the remaining fields. Keys are identical to
+        SHA-256 of _canonical_json over the combined parameters.
+        """
+        # Parameters sorting before and after 'page' in the serialized key
+        params_before = {
+            'content_hashes': self._doc_content_hashes(doc_group),
             'extraction_model': extraction_model,
-            'thresholds': json.dumps(thresholds, sort_keys=True)
+            'ocr_model': ocr_model,
+        }
+        params_after = {
+            'thresholds': _canonical_json(thresholds)
         }
+        prefix_hasher = hashlib.sha256(
+            (_canonical_json(params_before)[:-1] + ', "page": ').encode()
+        )
+        suffix = (', ' + _canonical_json(params_after)[1:]).encode()
         
-        # Generate SHA-256 hash
-        params_str = json.dumps(params, sort_keys=True)
-        cache_key = hashlib.sha256(params_str.encode()).hexdigest()
+        def page_cache_key(page_num: int) -> str:
+            hasher = prefix_hasher.copy()
+            hasher.update(b"%d" % page_num)
+            hasher.update(suffix)
+            return hasher.hexdigest()
         
-        return cache_key
+        return page_cache_key
+    
+    def _create_page_cache_key(self, doc_group: dict, page_num: int, ocr_model: str, 
+                              extraction_model: str, thresholds: dict) -> str:
+        """Create unique cache key using content fingerprints instead of file paths"""
+        return self._page_key_builder(doc_group, ocr_model, extraction_model, thresholds)(page_num)
     
     def _create_run_cache_key(self, doc_group: dict, start_page: int, end_page: int,
                              ocr_model: str, extraction_model: str, thresholds: dict) -> str:
@@ -283,10 +392,10 @@ class SimpleArtifactDB:
             'end_page': end_page,
             'ocr_model': ocr_model,
             'extraction_model': extraction_model,
-            'thresholds': json.dumps(thresholds, sort_keys=True)
+            'thresholds': _canonical_json(thresholds)
         }
         
-        params_str = json.dumps(params, sort_keys=True)
+        params_str = _canonical_json(params)
         run_cache_key = hashlib.sha256(params_str.encode()).hexdigest()
         
         logger.debug(f"🔍 Run cache key generated: {run_cache_key[:16]}...")
@@ -319,6 +428,101 @@ class SimpleArtifactDB:
             "processing_params_hash": processing_params_hash
         }
 
+    def _resolve_page_file_hash(self, doc_group: dict, provided_file_hash: str = None) -> Optional[str]:
+        """Return the file hash stored with page artifacts, or None if it cannot be determined"""
+        # Get main file hash - use provided hash if available, otherwise create content fingerprint
+        if provided_file_hash:
+            logger.info(f"💾 Using provided file hash: {provided_file_hash[:16]}...")
+            return provided_file_hash
+        
+        en_file = doc_group.get("EN", "")
+        if en_file and os.path.exists(en_file):
+            # Use content fingerprint for reliable, fast identification
+            file_hash = self._create_content_fingerprint(en_file)
+            logger.info(f"💾 Created content fingerprint: {file_hash[:16]}...")
+        else:
+            # Content-based fallback using original filename from session state
+            try:
+                if STREAMLIT_AVAILABLE and st and hasattr(st, 'session_state') and hasattr(st.session_state, 'uploaded_file_names'):
+                    original_name = st.session_state.uploaded_file_names.get("EN", "")
+                    if original_name:
+                        file_hash = hashlib.sha256(original_name.encode()).hexdigest()
+                        logger.info(f"💾 Using filename-based hash: {file_hash[:16]}... (from: {original_name})")
+                    else:
+                        logger.error("💾 Cannot create file hash - no file or filename available")
+                        return None
+                else:
+                    logger.error("💾 Cannot create file hash - session state not available and no file exists")
+                    return None
+            except Exception as e:
+                logger.error(f"💾 Error accessing session state for file hash: {e}")
+                return None
+        
+        if not file_hash:
+            logger.error("💾 Cannot create file hash for page artifacts")
+            return None
+        return file_hash
+
+    def _select_by_page_cache_keys(self, columns: str, page_cache_keys: List[str]) -> List[Dict]:
+        """Fetch all artifacts rows for the given page cache keys
+        
+        Keys are sent CACHE_LOOKUP_BATCH_SIZE at a time, and each batch's results are paged
+        with .range() until a short page comes back, so no response is cut off at max-rows.
+        """
+        rows = []
+        for batch_start in range(0, len(page_cache_keys), CACHE_LOOKUP_BATCH_SIZE):
+            batch_keys = page_cache_keys[batch_start:batch_start + CACHE_LOOKUP_BATCH_SIZE]
+            offset = 0
+            while True:
+                result = self.supabase_client.table("artifacts").select(columns).in_(
+                    "page_cache_key", batch_keys
+                ).order("page_cache_key").order("id").range(
+                    offset, offset + CACHE_LOOKUP_PAGE_ROWS - 1
+                ).execute()
+                page_rows = result.data or []
+                rows.extend(page_rows)
+                if len(page_rows) < CACHE_LOOKUP_PAGE_ROWS:
+                    break
+                offset += CACHE_LOOKUP_PAGE_ROWS
+        return rows
+    
+    def _store_local_pages(self, pages: Dict[str, List[Dict]]):
+        """Keep local copies of complete cached pages ({page_cache_key: artifacts}) and bound the store"""
+        if not self.local_cache_dir or not pages:
+            return
+        for page_cache_key, page_artifacts in pages.items():
+            extraction_cache.put(self.local_cache_dir, page_cache_key, page_artifacts)
+        extraction_cache.prune(self.local_cache_dir, LOCAL_PAGE_CACHE_SIZE_LIMIT)
+    
+    def _store_local_rows(self, rows: List[Dict]):
+        """Write newly inserted pages through to the local page cache"""
+        pages = {}
+        for row in rows:
+            pages.setdefault(row["page_cache_key"], []).append(_record_to_artifact(row, row["page_number"]))
+        self._store_local_pages(pages)
+    
+    def _insert_artifact_rows(self, rows: List[Dict]) -> int:
+        """Insert mapped artifact rows in one request, falling back to row by row to isolate bad records
+        
+        Returns:
+            int: number of rows saved
+        """
+        try:
+            self.supabase_client.table("artifacts").insert(rows).execute()
+            self._store_local_rows(rows)
+            return len(rows)
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(rows)} artifacts failed, inserting individually: {e}")
+        
+        saved_count = 0
+        for row in rows:
+            try:
+                self.supabase_client.table("artifacts").insert(row).execute()
+                saved_count += 1
+            except Exception as e:
+                logger.error(f"Error saving individual artifact: {e}")
+        return saved_count
+    
     def save_page_artifacts(self, doc_group: dict, page_num: int, artifacts: List[Dict],
                           ocr_model: str, extraction_model: str, thresholds: dict, 
                           provided_file_hash: str = None) -> bool:
@@ -330,45 +534,15 @@ class SimpleArtifactDB:
         logger.info(f"💾 DB Save - OCR model: '{ocr_model}', Extraction model: '{extraction_model}'")
             
         try:
-            # Get main file hash - use provided hash if available, otherwise create content fingerprint
-            if provided_file_hash:
-                file_hash = provided_file_hash
-                logger.info(f"💾 Using provided file hash: {file_hash[:16]}...")
-            else:
-                en_file = doc_group.get("EN", "")
-                if en_file and os.path.exists(en_file):
-                    # Use content fingerprint for reliable, fast identification
-                    file_hash = self._create_content_fingerprint(en_file)
-                    logger.info(f"💾 Created content fingerprint: {file_hash[:16]}...")
-                else:
-                    # Content-based fallback using original filename from session state
-                    try:
-                        if STREAMLIT_AVAILABLE and st and hasattr(st, 'session_state') and hasattr(st.session_state, 'uploaded_file_names'):
-                            original_name = st.session_state.uploaded_file_names.get("EN", "")
-                            if original_name:
-                                file_hash = hashlib.sha256(original_name.encode()).hexdigest()
-                                logger.info(f"💾 Using filename-based hash: {file_hash[:16]}... (from: {original_name})")
-                            else:
-                                logger.error("💾 Cannot create file hash - no file or filename available")
-                                return False
-                        else:
-                            logger.error("💾 Cannot create file hash - session state not available and no file exists")
-                            return False
-                    except Exception as e:
-                        logger.error(f"💾 Error accessing session state for file hash: {e}")
-                        return False
-            
+            file_hash = self._resolve_page_file_hash(doc_group, provided_file_hash)
             if not file_hash:
-                logger.error("💾 Cannot create file hash for page artifacts")
                 return False
             
             # Create cache keys
             page_cache_key = self._create_page_cache_key(
                 doc_group, page_num, ocr_model, extraction_model, thresholds
             )
-            processing_params_hash = hashlib.sha256(
-                json.dumps(thresholds, sort_keys=True).encode()
-            ).hexdigest()
+            processing_params_hash = _processing_params_hash(thresholds)
             
             # Check if this page is already cached
             existing_check = self.supabase_client.table("artifacts").select("id").eq(
@@ -379,8 +553,8 @@ class SimpleArtifactDB:
                 logger.info(f"Page {page_num} already cached, skipping save")
                 return True
             
-            # Map and save each artifact
-            saved_count = 0
+            # Map each artifact and save the page in one insert
+            rows = []
             for artifact in artifacts:
                 # Use the source_document from the artifact itself (which is already correct in the UI)
                 artifact_source_document = artifact.get("source_document", "")
@@ -392,14 +566,9 @@ class SimpleArtifactDB:
                 
                 # Add file hash
                 mapped_artifact["file_hash"] = file_hash
-                
-                try:
-                    self.supabase_client.table("artifacts").insert(mapped_artifact).execute()
-                    saved_count += 1
-                except Exception as e:
-                    logger.error(f"Error saving individual artifact: {e}")
-                    continue
+                rows.append(mapped_artifact)
             
+            saved_count = self._insert_artifact_rows(rows)
             logger.info(f"💾 Saved {saved_count} artifacts for page {page_num}")
             return saved_count > 0
             
@@ -407,6 +576,54 @@ class SimpleArtifactDB:
             logger.error(f"Error saving page artifacts: {e}")
             return False
 
+    def save_pages_artifacts(self, doc_group: dict, artifacts_by_page: Dict[int, List[Dict]],
+                             ocr_model: str, extraction_model: str, thresholds: dict,
+                             provided_file_hash: str = None) -> bool:
+        """Save artifacts for several pages with one cache lookup and one insert"""
+        artifacts_by_page = {page_num: artifacts for page_num, artifacts in artifacts_by_page.items() if artifacts}
+        if not self.enabled or not artifacts_by_page:
+            return False
+        
+        try:
+            file_hash = self._resolve_page_file_hash(doc_group, provided_file_hash)
+            if not file_hash:
+                return False
+            
+            processing_params_hash = _processing_params_hash(thresholds)
+            page_cache_key = self._page_key_builder(doc_group, ocr_model, extraction_model, thresholds)
+            page_cache_keys = {page_num: page_cache_key(page_num) for page_num in artifacts_by_page}
+            
+            # Skip pages that are already cached
+            cached_keys = {
+                row["page_cache_key"]
+                for row in self._select_by_page_cache_keys("page_cache_key", list(page_cache_keys.values()))
+            }
+            
+            rows = []
+            for page_num, artifacts in artifacts_by_page.items():
+                page_cache_key = page_cache_keys[page_num]
+                if page_cache_key in cached_keys:
+                    logger.info(f"Page {page_num} already cached, skipping save")
+                    continue
+                for artifact in artifacts:
+                    mapped_artifact = self._map_artifact_to_new_schema(
+                        artifact, page_cache_key, page_num, ocr_model,
+                        extraction_model, processing_params_hash, artifact.get("source_document", "")
+                    )
+                    mapped_artifact["file_hash"] = file_hash
+                    rows.append(mapped_artifact)
+            
+            if not rows:
+                return True
+            
+            saved_count = self._insert_artifact_rows(rows)
+            logger.info(f"💾 Saved {saved_count} artifacts for {len({row['page_number'] for row in rows})} pages in one batch")
+            return saved_count > 0
+            
+        except Exception as e:
+            logger.error(f"Error saving page artifacts in batch: {e}")
+            return False
+
     def save_run_statistics(self, doc_group: dict, start_page: int, end_page,
                           ocr_model: str, extraction_model: str, thresholds: dict,
                           total_artifacts: int, cached_pages: int, processed_pages: int, 
@@ -434,9 +651,7 @@ class SimpleArtifactDB:
             run_cache_key = self._create_run_cache_key(
                 doc_group, start_page, end_page, ocr_model, extraction_model, thresholds
             )
-            processing_params_hash = hashlib.sha256(
-                json.dumps(thresholds, sort_keys=True).encode()
-            ).hexdigest()
+            processing_params_hash = _processing_params_hash(thresholds)
             
             # Save run statistics
             run_record = {
@@ -533,28 +748,14 @@ class SimpleArtifactDB:
                     "limit_count": limit
                 }).execute()
             else:
-                result = self.supabase_client.table("artifacts").select("*").order(
+                result = self.supabase_client.table("artifacts").select(_ARTIFACT_SELECT).order(
                     "created_at", desc=True
                 ).limit(limit).execute()
             
             # Convert back to original format for compatibility
-            artifacts = []
-            for record in result.data:
-                artifact = {
-                    "Name_EN": record.get("name_en", ""),
-                    "Name_AR": record.get("name_ar", ""),
-                    "Name_FR": record.get("name_fr", ""),
-                    "Creator": record.get("creator", ""),
-                    "Creation Date": record.get("creation_date", ""),
-                    "Materials": record.get("materials", ""),
-                    "Origin": record.get("origin", ""),
-                    "Description": record.get("description", ""),
-                    "Category": record.get("category", ""),
-                    "source_page": record.get("source_page", record.get("page_number", "")),
-                    "source_document": record.get("source_document", ""),
-                    "Name_validation": record.get("name_validation", "")
-                }
-                artifacts.append(artifact)
+            artifacts = [
+                _record_to_artifact(record, record.get("page_number", "")) for record in result.data
+            ]
             
             logger.info(f"🔍 Found {len(artifacts)} artifacts matching query")
             return artifacts
@@ -612,10 +813,14 @@ class SimpleArtifactDB:
 
 # Global instance
 _db_instance = None
+_db_instance_lock = threading.Lock()
 
 def get_simple_db() -> SimpleArtifactDB:
     """Get the global database instance"""
     global _db_instance
     if _db_instance is None:
-        _db_instance = SimpleArtifactDB()
+        # Pages run on worker threads; make sure only one client (and connection pool) is built
+        with _db_instance_lock:
+            if _db_instance is None:
+                _db_instance = SimpleArtifactDB()
     return _db_instance
@@ -5,6 +5,37 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Prompt-text normalisation: control characters (except tab/newline), zero-width spaces and BOMs,
+# runs of spaces/tabs, trailing spaces, blank-line runs, and lines an OCR pass repeated back to back
+_INVISIBLE_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f\u200b\ufeff]')
+_INLINE_SPACE_RE = re.compile(r'[ \t]+')
+_TRAILING_SPACE_RE = re.compile(r' +(?=\n)')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_REPEATED_LINE_RE = re.compile(r'^([^\n]+)(?:\n\1)+$', re.MULTILINE)
+
+# Model-response JSON recovery: fenced code blocks, the outermost array, loose objects,
+# and the comma fixes applied before retrying json.loads
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*\n([\s\S]*?)\n\s*```')
+_JSON_ARRAY_RE = re.compile(r'\[([\s\S]*)\]')
+_JSON_OBJECT_RE = re.compile(r'{\s*"[^}]*}')
+_TRAILING_COMMA_RE = re.compile(r',(\s*[\]}])')
+_OBJECT_TRAILING_COMMA_RE = re.compile(r',(\s*})')
+_MISSING_COMMA_RE = re.compile(r'"([^"]*)"(\s*")')
+
+def compact(text):
+    """Shrink OCR text before embedding it in a prompt without changing its visible content."""
+    if not text:
+        return text
+    
+    compacted = _INVISIBLE_RE.sub('', text.replace('\r\n', '\n').replace('\r', '\n'))
+    compacted = _INLINE_SPACE_RE.sub(' ', compacted)
+    compacted = _TRAILING_SPACE_RE.sub('', compacted)
+    compacted = _BLANK_LINES_RE.sub('\n\n', compacted)
+    compacted = _REPEATED_LINE_RE.sub(r'\1', compacted).strip()
+    
+    logger.debug(f"Compacted prompt text from {len(text)} to {len(compacted)} characters")
+    return compacted
+
 def calculate_text_difference(text1, text2):
     """
     Calculate similarity between texts using character-level Levenshtein distance.
@@ -62,7 +93,7 @@ def parse_artifacts_from_text(text, page_num, document_name):
         return []
     
     # Extract code blocks if present
-    code_blocks = re.findall(r'```(?:json)?\s*\n([\s\S]*?)\n\s*```', text)
+    code_blocks = _CODE_BLOCK_RE.findall(text)
     
     if code_blocks:
         cleaned_text = code_blocks[0]
@@ -88,13 +119,13 @@ def parse_artifacts_from_text(text, page_num, document_name):
             pass
         
         # Method 2: Extract array with regex
-        array_match = re.search(r'\[([\s\S]*)\]', cleaned_text)
+        array_match = _JSON_ARRAY_RE.search(cleaned_text)
         if array_match:
             try:
                 array_text = '[' + array_match.group(1) + ']'
                 # Try to fix common JSON formatting issues
                 array_text = array_text.replace('"\n', '",\n')
-                array_text = re.sub(r',(\s*[\]}])', r'\1', array_text)  # Remove trailing commas
+                array_text = _TRAILING_COMMA_RE.sub(r'\1', array_text)  # Remove trailing commas
                 
                 parsed_json = json.loads(array_text)
                 for artifact in parsed_json:
@@ -105,15 +136,15 @@ def parse_artifacts_from_text(text, page_num, document_name):
                 pass
         
         # Method 3: Extract individual objects
-        object_matches = re.findall(r'{\s*"[^}]*}', cleaned_text)
+        object_matches = _JSON_OBJECT_RE.findall(cleaned_text)
         if object_matches:
             result = []
             for obj_text in object_matches:
                 try:
                     # Add missing comma to end of string values if needed
-                    fixed_obj = re.sub(r'"([^"]*)"(\s*")', r'"\1",\2', obj_text)
+                    fixed_obj = _MISSING_COMMA_RE.sub(r'"\1",\2', obj_text)
                     # Remove trailing commas
-                    fixed_obj = re.sub(r',(\s*})', r'\1', fixed_obj)
+                    fixed_obj = _OBJECT_TRAILING_COMMA_RE.sub(r'\1', fixed_obj)
                     
                     obj = json.loads(fixed_obj)
                     obj["source_page"] = page_num
@@ -155,7 +186,7 @@ def parse_artifacts_from_text(text, page_num, document_name):
 def parse_multilingual_names(text, artifacts_en, page_num, document_name):
     """Parse multilingual artifact names from model response."""
     # Extract code blocks if present
-    code_blocks = re.findall(r'```(?:json)?\s*\n([\s\S]*?)\n\s*```', text)
+    code_blocks = _CODE_BLOCK_RE.findall(text)
     
     if code_blocks:
         cleaned_text = code_blocks[0]
@@ -169,12 +200,12 @@ def parse_multilingual_names(text, artifacts_en, page_num, document_name):
             parsed_json = json.loads(cleaned_text)
         except json.JSONDecodeError:
             # Try to extract array with regex
-            array_match = re.search(r'\[([\s\S]*)\]', cleaned_text)
+            array_match = _JSON_ARRAY_RE.search(cleaned_text)
             if array_match:
                 array_text = '[' + array_match.group(1) + ']'
                 # Try to fix common JSON formatting issues
                 array_text = array_text.replace('"\n', '",\n')
-                array_text = re.sub(r',(\s*[\]}])', r'\1', array_text)  # Remove trailing commas
+                array_text = _TRAILING_COMMA_RE.sub(r'\1', array_text)  # Remove trailing commas
                 parsed_json = json.loads(array_text)
         
         if not parsed_json:
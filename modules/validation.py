@@ -6,6 +6,9 @@ from .api_calls import call_api_for_model, extract_content_from_response
 
 logger = logging.getLogger(__name__)
 
+# Fenced (optionally json-tagged) code block in a model response
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*\n([\s\S]*?)\n\s*```')
+
 def validate_and_complete_multilingual_names(artifacts, model, validation_prompt_func):
     """Cross-validate and complete multilingual artifact names."""
     if not artifacts:
@@ -26,7 +29,7 @@ def validate_and_complete_multilingual_names(artifacts, model, validation_prompt
         validated_artifacts = []
         try:
             # Extract JSON from the response
-            code_blocks = re.findall(r'```(?:json)?\s*\n([\s\S]*?)\n\s*```', validation_text)
+            code_blocks = _CODE_BLOCK_RE.findall(validation_text)
             if code_blocks:
                 validated_artifacts = json.loads(code_blocks[0])
             else:
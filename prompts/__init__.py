@@ -472,28 +472,28 @@ class ArtifactExtractionPrompt:
 class MultilingualNameExtractionPrompt:
     """Prompt for extracting just the names of artifacts in other languages."""
     
-    def format(self, artifact_list, target_language, page_number=None, context=None) -> str:
-        """Format the prompt for extracting artifact names in other languages."""
-        
-        # Convert artifacts to a readable text format
-        artifacts_text = ""
-        for i, artifact in enumerate(artifact_list, 1):
-            artifacts_text += f"Artifact #{i}: {artifact.get('Name', 'Unknown')}\n"
-            artifacts_text += f"Description: {artifact.get('Description', 'No description')}\n"
-            artifacts_text += f"Category: {artifact.get('Category', 'No category')}\n\n"
+    # Language-dependent prompt sections, built once per target language
+    _sections = {}
+    
+    @classmethod
+    def _language_sections(cls, target_language):
+        """Return the (language_name, header, instructions) text for a target language."""
+        sections = cls._sections.get(target_language)
+        if sections is not None:
+            return sections
         
         language_name = "Arabic" if target_language == "AR" else "French"
         field_name = f"{language_name}_Name"  # This will be "Arabic_Name" or "French_Name"
         
-        extraction_prompt = (
+        header = (
             f"**ABSOLUTELY NON-NEGOTIABLE {language_name.upper()} ARTIFACT NAME EXTRACTION PROTOCOL -- FAILURE IS NOT AN OPTION**\n\n"
             
             f"YOU ARE A MULTILINGUAL ARTIFACT NAME EXTRACTION MACHINE. **YOUR MISSION: FIND THE EXACT {language_name.upper()} NAMES OF THESE ARTIFACTS WITH 100% ACCURACY.** ANYTHING LESS = CATASTROPHIC FAILURE.\n\n"
             
             f"## **THE ENGLISH ARTIFACTS BELOW MUST BE MATCHED WITH THEIR {language_name.upper()} EQUIVALENTS:**\n\n"
-            
-            f"{artifacts_text}\n"
-            
+        )
+        
+        instructions = (
             f"### **NON-NEGOTIABLE EXTRACTION DIRECTIVES -- BREAKING THESE WILL CAUSE SYSTEMIC COLLAPSE:**\n\n"
             
             f"1. **READ EVERY WORD OF THE {language_name.upper()} TEXT WITH MICROSCOPIC PRECISION.**\n"
@@ -513,10 +513,40 @@ class MultilingualNameExtractionPrompt:
             f"```\n\n"
             
             f"**CRITICAL: YOU MUST USE \"{field_name}\" AS THE EXACT FIELD NAME. ANY DEVIATION = MISSION FAILURE.**\n\n"
+        )
+        
+        sections = (language_name, header, instructions)
+        cls._sections[target_language] = sections
+        return sections
+    
+    def format(self, artifact_list, target_language, page_number=None, context=None,
+               extracted_text="{extracted_text}") -> str:
+        """Format the prompt for extracting artifact names in other languages.
+        
+        extracted_text defaults to a literal {extracted_text} placeholder for
+        callers that substitute the text themselves.
+        """
+        
+        # Convert artifacts to a readable text format
+        artifacts_text = "".join(
+            f"Artifact #{i}: {artifact.get('Name', 'Unknown')}\n"
+            f"Description: {artifact.get('Description', 'No description')}\n"
+            f"Category: {artifact.get('Category', 'No category')}\n\n"
+            for i, artifact in enumerate(artifact_list, 1)
+        )
+        
+        language_name, header, instructions = self._language_sections(target_language)
+        
+        extraction_prompt = (
+            f"{header}"
+            
+            f"{artifacts_text}\n"
+            
+            f"{instructions}"
             
             f"Document context: {context}\n"
             f"Page number: {page_number}\n"
-            f"{language_name} text:\n\n{{extracted_text}}\n\n"
+            f"{language_name} text:\n\n{extracted_text}\n\n"
             
             f"**THIS IS A ZERO-TOLERANCE ENVIRONMENT.** ABSOLUTE COMPLIANCE IS REQUIRED. THERE IS NO FLEXIBILITY, NO EXCEPTIONS, AND NO ROOM FOR ERROR.\n\n"
             
@@ -0,0 +1,42 @@
+"""Tests for parsing model responses in modules.extraction"""
+import unittest
+
+from modules.extraction import _parse_artifacts, parse_name_mappings
+
+ARTIFACT_JSON = '[{"Name": "Golden Mask", "Category": "JEWELRY"}]'
+
+class ParseArtifactsTest(unittest.TestCase):
+    def assert_golden_mask(self, content):
+        artifacts = _parse_artifacts(content, 3, "catalogue.pdf")
+        self.assertEqual([artifact["Name"] for artifact in artifacts], ["Golden Mask"])
+        self.assertEqual(artifacts[0]["source_page"], 3)
+    
+    def test_plain_array(self):
+        self.assert_golden_mask(ARTIFACT_JSON)
+    
+    def test_multiline_fence(self):
+        self.assert_golden_mask(f"```json\n{ARTIFACT_JSON}\n```")
+    
+    def test_single_line_fence(self):
+        self.assert_golden_mask(f"```json {ARTIFACT_JSON} ```")
+    
+    def test_trailing_fence_on_array_line(self):
+        self.assert_golden_mask(f"{ARTIFACT_JSON}```")
+    
+    def test_bracketed_prose_before_array(self):
+        self.assert_golden_mask(f"Found [1] artifact:\n```json\n{ARTIFACT_JSON}\n```")
+    
+    def test_prose_without_json(self):
+        self.assertIsNone(_parse_artifacts("No artifacts on this page.", 3, "catalogue.pdf"))
+
+class ParseNameMappingsTest(unittest.TestCase):
+    NAMES_JSON = '[{"English_Name": "Golden Mask", "Arabic_Name": "القناع الذهبي"}]'
+    
+    def test_multiline_fence(self):
+        self.assertEqual(len(parse_name_mappings(f"```json\n{self.NAMES_JSON}\n```", "AR")), 1)
+    
+    def test_single_line_fence(self):
+        self.assertEqual(len(parse_name_mappings(f"```json {self.NAMES_JSON} ```", "AR")), 1)
+
+if __name__ == "__main__":
+    unittest.main()